@@ -13,6 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.routers import contracts, email_intake, sales, sales_upload
 from app.db import supabase_admin
+from app.services.extractor import close_async_clients
 
 # Configure logging to output to console
 logging.basicConfig(
@@ -203,6 +204,12 @@ async def log_startup_urls() -> None:
     )
 
 
+@app.on_event("shutdown")
+async def close_extractor_clients() -> None:
+    """Close the pooled Anthropic clients the contract extractor opened."""
+    await close_async_clients()
+
+
 @app.get("/")
 async def root():
     return {"message": "Likha API", "version": "0.1.0"}
@@ -43,6 +43,23 @@ def _refresh_pdf_url(contract: Contract) -> Contract:
     return contract
 
 
+def _require_pdf(file: UploadFile) -> UploadFile:
+    """
+    Reject uploads that are neither named *.pdf nor sent as application/pdf.
+
+    Either signal is enough: mobile browsers may omit the filename or the
+    content type.
+
+    Raises:
+        HTTPException: 400 if the file does not look like a PDF.
+    """
+    is_pdf_by_name = (file.filename or "").lower().endswith(".pdf")
+    is_pdf_by_type = (file.content_type or "").lower() == "application/pdf"
+    if not is_pdf_by_name and not is_pdf_by_type:
+        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+    return file
+
+
 @router.post(
     "/extract",
     response_model=dict,
@@ -132,13 +149,8 @@ async def extract_contract_terms(
         f"content_type={file.content_type!r}"
     )
 
+    _require_pdf(file)
     filename_lower = (file.filename or "").lower()
-    content_type = (file.content_type or "").lower()
-    is_pdf_by_name = filename_lower.endswith(".pdf")
-    is_pdf_by_type = content_type == "application/pdf"
-
-    if not is_pdf_by_name and not is_pdf_by_type:
-        raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
     # Normalise the filename: mobile browsers (e.g. Android Chrome) sometimes
     # send None or a content URI instead of a real filename.  Fall back to a
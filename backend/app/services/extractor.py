@@ -3,16 +3,54 @@ Contract extraction service.
 Ports the extraction logic from the spike to a reusable service.
 """
 
+import asyncio
+import functools
+import hashlib
 import os
-from typing import Tuple
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+import httpx
 import pdfplumber
 import anthropic
+from pydantic import ValidationError
 from app.models.contract import ExtractedTerms
 
+# PyMuPDF is the fast path for PDF text extraction. pdfplumber stays as the
+# fallback so environments without the MuPDF wheel keep working.
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
 # Model configuration
 MODEL = "claude-sonnet-4-5-20250929"
 MAX_TOKENS = 4096
 
+# Seconds between status checks while a Message Batch is processing
+BATCH_POLL_INTERVAL_SECONDS = 30
+
+# How many times to re-ask Claude when its reply is not valid ExtractedTerms JSON
+MAX_PARSE_RETRIES = 1
+
+# Leading ``` / ```json fence and trailing ``` fence around Claude's JSON
+_CODE_FENCE_RE = re.compile(r"^```[A-Za-z]*[ \t]*\n?|\n?[ \t]*```$")
+
+# Connection pool for the shared Anthropic client. Uploads arrive minutes
+# apart, so keep idle connections longer than the SDK's 5s default to skip
+# the TLS handshake on the next extraction.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
+
+# Number of extraction results kept in the in-process response cache
+RESPONSE_CACHE_SIZE = 256
+
 EXTRACTION_PROMPT = """\
 You are a licensing contract analyst. Analyze the following licensing agreement and extract the key terms into structured JSON.
 
@@ -70,18 +108,62 @@ Respond with ONLY valid JSON matching this schema:
   "confidence_score": float,
   "extraction_notes": [string]
 }
-
-CONTRACT TEXT:
-{contract_text}
 """
 
+# The instructions are identical on every call, so they go in the system
+# prompt marked for Anthropic prompt caching. Only the contract text varies.
+SYSTEM_PROMPT = [
+    {
+        "type": "text",
+        "text": EXTRACTION_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """
-    Extract text from a PDF using pdfplumber.
-    Handles tables and complex layouts.
-    Does NOT support scanned PDFs (no OCR).
-    """
+def _format_table(page_number: int, table: List[List[Optional[str]]]) -> Optional[str]:
+    """Render an extracted table as pipe-separated rows, or None if empty."""
+    rows = []
+    for row in table:
+        cells = [str(cell).strip() if cell else "" for cell in row]
+        rows.append(" | ".join(cells))
+    if not rows:
+        return None
+    return f"[Table on page {page_number}]\n" + "\n".join(rows)
+
+
+def _page_parts_pymupdf(page, page_number: int) -> List[str]:
+    """Text and rendered tables for a single PyMuPDF page."""
+    parts = []
+
+    page_text = page.get_text("text").strip()
+    if page_text:
+        parts.append(f"--- Page {page_number} ---\n{page_text}")
+
+    # find_tables() uses the "lines" strategy, which builds cells from vector
+    # line art. Pages without any drawings cannot yield a table, so skip the
+    # analysis there; it costs far more than the text extraction itself.
+    if page.get_cdrawings():
+        for table in page.find_tables().tables:
+            rendered = _format_table(page_number, table.extract())
+            if rendered:
+                parts.append(rendered)
+
+    return parts
+
+
+def _extract_parts_pymupdf(pdf_path: str) -> List[str]:
+    """Extract page text and tables with PyMuPDF (MuPDF C library)."""
+    with pymupdf.open(pdf_path) as doc:
+        return [
+            part
+            for index, page in enumerate(doc)
+            for part in _page_parts_pymupdf(page, index + 1)
+        ]
+
+
+def _extract_parts_pdfplumber(pdf_path: str) -> List[str]:
+    """Extract page text and tables with pdfplumber (pure-Python fallback)."""
     text_parts = []
 
     with pdfplumber.open(pdf_path) as pdf:
@@ -91,15 +173,26 @@ def extract_text_from_pdf(pdf_path: str) -> str:
                 text_parts.append(f"--- Page {i} ---\n{page_text}")
 
             # Extract tables
-            tables = page.extract_tables()
-            for table in tables:
+            for table in page.extract_tables():
                 if table:
-                    rows = []
-                    for row in table:
-                        cells = [str(cell).strip() if cell else "" for cell in row]
-                        rows.append(" | ".join(cells))
-                    if rows:
-                        text_parts.append(f"[Table on page {i}]\n" + "\n".join(rows))
+                    rendered = _format_table(i, table)
+                    if rendered:
+                        text_parts.append(rendered)
+
+    return text_parts
+
+
+def extract_text_from_pdf(pdf_path: str) -> str:
+    """
+    Extract text from a PDF.
+    Uses PyMuPDF when installed, falling back to pdfplumber.
+    Handles tables and complex layouts.
+    Does NOT support scanned PDFs (no OCR).
+    """
+    if pymupdf is not None:
+        text_parts = _extract_parts_pymupdf(pdf_path)
+    else:
+        text_parts = _extract_parts_pdfplumber(pdf_path)
 
     full_text = "\n\n".join(text_parts)
 
@@ -112,63 +205,391 @@ def extract_text_from_pdf(pdf_path: str) -> str:
     return full_text
 
 
+# Re-processing the same contract text returns the cached terms instead of
+# paying for another Claude call. Values are ExtractedTerms JSON so every hit
+# gets a fresh model instance.
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(contract_text: str) -> str:
+    """Cache key: model name + a 128-bit hash of the contract text."""
+    digest = hashlib.blake2b(contract_text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{MODEL}:{digest}"
+
+
+def _get_cached_terms(key: str) -> Optional[Tuple[ExtractedTerms, dict]]:
+    """Return (ExtractedTerms, zero token_usage) on a cache hit, else None."""
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is None:
+            return None
+        _response_cache.move_to_end(key)
+
+    token_usage = {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "total_tokens": 0,
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": 0,
+    }
+    return ExtractedTerms.model_validate_json(cached), token_usage
+
+
+def _store_cached_terms(key: str, extracted: ExtractedTerms) -> None:
+    """Store an extraction result, evicting the least recently used entry."""
+    with _response_cache_lock:
+        _response_cache[key] = extracted.model_dump_json()
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def clear_response_cache() -> None:
+    """Drop all cached extraction results."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_client(api_key: Optional[str]) -> anthropic.Anthropic:
+    """
+    Return the shared sync Anthropic client for an API key.
+
+    Built once per key so every extraction reuses its keep-alive pool.
+    """
+    return anthropic.Anthropic(
+        api_key=api_key,
+        http_client=anthropic.DefaultHttpxClient(limits=HTTP_POOL_LIMITS),
+    )
+
+
+# httpx async clients are bound to the event loop they first run on, so the
+# shared AsyncAnthropic clients are kept per loop. Each one holds its pool
+# until close_async_clients() runs on that loop; the app calls it on shutdown.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Optional[str], anthropic.AsyncAnthropic]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_default_async_client(api_key: Optional[str]) -> anthropic.AsyncAnthropic:
+    """
+    Return the shared AsyncAnthropic client for an API key on the running loop.
+
+    Built once per (loop, key) with HTTP_POOL_LIMITS so every extraction
+    reuses its keep-alive pool instead of opening (and leaking) a new one.
+    """
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=HTTP_POOL_LIMITS),
+        )
+        clients[api_key] = client
+    return client
+
+
+async def close_async_clients() -> None:
+    """Close the shared AsyncAnthropic clients of the running loop and forget them."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def _build_messages(contract_text: str) -> List[dict]:
+    """Build the Messages API payload for a contract."""
+    return [{"role": "user", "content": f"CONTRACT TEXT:\n{contract_text}"}]
+
+
+def _parse_extraction_response(response) -> ExtractedTerms:
+    """
+    Turn a Messages API response into ExtractedTerms.
+
+    Raises pydantic.ValidationError if the reply is not valid JSON matching
+    the ExtractedTerms schema.
+    """
+    raw_text = response.content[0].text
+
+    # Parse JSON (handle markdown code fences)
+    json_text = raw_text.strip()
+    if json_text.startswith("```"):
+        json_text = _CODE_FENCE_RE.sub("", json_text)
+
+    # Parse and validate in one pass with pydantic-core
+    return ExtractedTerms.model_validate_json(json_text)
+
+
+def _add_token_usage(token_usage: Optional[dict], response) -> dict:
+    """Add a response's usage to the running token_usage totals."""
+    usage = response.usage
+    counts = {
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "total_tokens": usage.input_tokens + usage.output_tokens,
+        # Prompt-cache accounting (None when caching did not apply)
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
+    }
+    if token_usage is None:
+        return counts
+    return {key: token_usage[key] + value for key, value in counts.items()}
+
+
+def _retry_messages(messages: List[dict], response, error: ValidationError) -> List[dict]:
+    """Extend the conversation with Claude's invalid reply and a correction request."""
+    first_error = error.errors()[0]["msg"]
+    return messages + [
+        {"role": "assistant", "content": response.content[0].text},
+        {
+            "role": "user",
+            "content": (
+                f"That reply could not be parsed ({first_error}). "
+                "Respond with ONLY valid JSON matching the schema."
+            ),
+        },
+    ]
+
+
 def extract_terms_with_claude(
     contract_text: str,
-    api_key: str = None
+    api_key: str = None,
+    *,
+    client: Optional[anthropic.Anthropic] = None,
 ) -> Tuple[ExtractedTerms, dict]:
     """
     Send contract text to Claude for extraction.
 
+    Identical contract text is served from the response cache with zero
+    token usage. Pass `client` to use a specific Anthropic client; otherwise
+    a shared client for `api_key` (default: ANTHROPIC_API_KEY) is used.
+
+    If the reply is not valid ExtractedTerms JSON, Claude is asked to correct
+    it up to MAX_PARSE_RETRIES times; token_usage covers every attempt.
+
     Returns:
         (ExtractedTerms, token_usage)
     """
-    if api_key is None:
-        api_key = os.getenv("ANTHROPIC_API_KEY")
+    cache_key = _response_cache_key(contract_text)
+    cached = _get_cached_terms(cache_key)
+    if cached is not None:
+        return cached
 
-    client = anthropic.Anthropic(api_key=api_key)
+    if client is None:
+        if api_key is None:
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+        client = _get_default_client(api_key)
 
-    prompt = EXTRACTION_PROMPT.replace("{contract_text}", contract_text)
+    messages = _build_messages(contract_text)
+    token_usage = None
 
-    response = client.messages.create(
-        model=MODEL,
-        max_tokens=MAX_TOKENS,
-        messages=[{"role": "user", "content": prompt}],
-    )
+    for attempt in range(MAX_PARSE_RETRIES + 1):
+        # Streamed only so the SDK does not refuse or time out a long
+        # non-streaming request; get_final_message() still waits for the
+        # complete reply before it is parsed.
+        with client.messages.stream(
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
+            system=SYSTEM_PROMPT,
+            messages=messages,
+        ) as stream:
+            response = stream.get_final_message()
 
-    raw_text = response.content[0].text
+        token_usage = _add_token_usage(token_usage, response)
+        try:
+            extracted = _parse_extraction_response(response)
+            break
+        except ValidationError as e:
+            if attempt == MAX_PARSE_RETRIES:
+                raise
+            messages = _retry_messages(messages, response, e)
 
-    # Parse JSON (handle markdown code fences)
-    json_text = raw_text.strip()
-    if json_text.startswith("```"):
-        lines = json_text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        json_text = "\n".join(lines)
+    _store_cached_terms(cache_key, extracted)
+    return extracted, token_usage
 
-    # Parse into Pydantic model
-    import json
-    extracted_dict = json.loads(json_text)
-    extracted = ExtractedTerms(**extracted_dict)
 
-    token_usage = {
-        "input_tokens": response.usage.input_tokens,
-        "output_tokens": response.usage.output_tokens,
-        "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-    }
+async def extract_terms_with_claude_async(
+    contract_text: str,
+    api_key: str = None,
+    *,
+    client: Optional[anthropic.AsyncAnthropic] = None,
+) -> Tuple[ExtractedTerms, dict]:
+    """
+    Async variant of extract_terms_with_claude.
+
+    Awaits the Anthropic API instead of blocking the event loop, so several
+    extractions can be in flight at once. Pass `client` to use a specific
+    AsyncAnthropic client; otherwise the shared client for `api_key` on the
+    running event loop is used.
+
+    Returns:
+        (ExtractedTerms, token_usage)
+    """
+    cache_key = _response_cache_key(contract_text)
+    cached = _get_cached_terms(cache_key)
+    if cached is not None:
+        return cached
 
+    if client is None:
+        if api_key is None:
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+        client = _get_default_async_client(api_key)
+
+    messages = _build_messages(contract_text)
+    token_usage = None
+
+    for attempt in range(MAX_PARSE_RETRIES + 1):
+        # Streamed to avoid long-request timeouts, as in the sync variant.
+        async with client.messages.stream(
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
+            system=SYSTEM_PROMPT,
+            messages=messages,
+        ) as stream:
+            response = await stream.get_final_message()
+
+        token_usage = _add_token_usage(token_usage, response)
+        try:
+            extracted = _parse_extraction_response(response)
+            break
+        except ValidationError as e:
+            if attempt == MAX_PARSE_RETRIES:
+                raise
+            messages = _retry_messages(messages, response, e)
+
+    _store_cached_terms(cache_key, extracted)
     return extracted, token_usage
 
 
-async def extract_contract(pdf_path: str) -> Tuple[ExtractedTerms, dict]:
+async def extract_contract(
+    pdf_path: str,
+    *,
+    client: Optional[anthropic.AsyncAnthropic] = None,
+) -> Tuple[ExtractedTerms, dict]:
     """
     Full extraction pipeline: PDF -> text -> Claude -> structured terms.
 
+    PDF parsing runs in a worker thread and the Claude call is awaited, so
+    the event loop stays free while a contract is being extracted.
+
     Returns:
         (ExtractedTerms, token_usage)
     """
     # Step 1: Extract text from PDF
-    contract_text = extract_text_from_pdf(pdf_path)
+    contract_text = await asyncio.to_thread(extract_text_from_pdf, pdf_path)
 
     # Step 2: Send to Claude
-    extracted, token_usage = extract_terms_with_claude(contract_text)
+    extracted, token_usage = await extract_terms_with_claude_async(
+        contract_text, client=client
+    )
 
     return extracted, token_usage
+
+
+async def extract_contracts_batch(
+    pdf_paths: List[str],
+    concurrency: int = 5,
+    *,
+    client: Optional[anthropic.AsyncAnthropic] = None,
+) -> List[Union[Tuple[ExtractedTerms, dict], BaseException]]:
+    """
+    Extract several contracts concurrently.
+
+    At most `concurrency` extractions run at a time. Results are returned in
+    the same order as `pdf_paths`; a failed extraction yields its exception
+    instead of aborting the whole batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _extract_one(pdf_path: str) -> Tuple[ExtractedTerms, dict]:
+        async with semaphore:
+            return await extract_contract(pdf_path, client=client)
+
+    return await asyncio.gather(
+        *(_extract_one(path) for path in pdf_paths),
+        return_exceptions=True,
+    )
+
+
+def extract_contracts_via_batch_api(
+    pdf_paths: List[str],
+    api_key: str = None,
+    *,
+    client: Optional[anthropic.Anthropic] = None,
+    poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+) -> List[Union[Tuple[ExtractedTerms, dict], BaseException]]:
+    """
+    Extract many contracts through the Anthropic Message Batches API.
+
+    All uncached contracts go out in a single batch (billed at the discounted
+    batch rate) and this call blocks, polling every `poll_interval` seconds,
+    until the batch has ended. Meant for bulk re-processing, not interactive
+    uploads.
+
+    Results are returned in the same order as `pdf_paths`; a contract whose
+    PDF, request or reply fails yields an exception in its slot. Invalid
+    replies are not retried on this path.
+    """
+    if client is None:
+        if api_key is None:
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+        client = _get_default_client(api_key)
+
+    results: List[Union[Tuple[ExtractedTerms, dict], BaseException, None]] = [None] * len(pdf_paths)
+    cache_keys = {}
+    requests = []
+
+    for index, pdf_path in enumerate(pdf_paths):
+        try:
+            contract_text = extract_text_from_pdf(pdf_path)
+        except Exception as e:
+            results[index] = e
+            continue
+
+        cache_key = _response_cache_key(contract_text)
+        cached = _get_cached_terms(cache_key)
+        if cached is not None:
+            results[index] = cached
+            continue
+
+        # custom_id must match ^[a-zA-Z0-9_-]{1,64}$, so use the index, not the path
+        cache_keys[index] = cache_key
+        requests.append({
+            "custom_id": f"contract-{index}",
+            "params": {
+                "model": MODEL,
+                "max_tokens": MAX_TOKENS,
+                "system": SYSTEM_PROMPT,
+                "messages": _build_messages(contract_text),
+            },
+        })
+
+    if not requests:
+        return results
+
+    batch = client.messages.batches.create(requests=requests)
+    while batch.processing_status != "ended":
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    for entry in client.messages.batches.results(batch.id):
+        index = int(entry.custom_id.rsplit("-", 1)[1])
+        result = entry.result
+
+        if result.type != "succeeded":
+            detail = getattr(result, "error", None)
+            results[index] = RuntimeError(
+                f"Batch extraction {result.type} for {pdf_paths[index]}: {detail}"
+            )
+            continue
+
+        try:
+            extracted = _parse_extraction_response(result.message)
+        except ValidationError as e:
+            results[index] = e
+            continue
+
+        _store_cached_terms(cache_keys[index], extracted)
+        results[index] = (extracted, _add_token_usage(None, result.message))
+
+    return results
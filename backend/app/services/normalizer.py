@@ -37,6 +37,13 @@ _REPORTING_FREQUENCY_MAP = {
 
 _ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+# First run of digits (with optional decimal) in a comma-stripped amount
+_MONEY_RE = re.compile(r"[\d]+(?:\.\d+)?")
+# Percentage number in strings like "8% of net sales" or "8%"
+_PERCENT_RE = re.compile(r"([\d]+(?:\.\d+)?)\s*%")
+# Bare number like "8.5" (no percent sign)
+_BARE_NUMBER_RE = re.compile(r"^([\d]+(?:\.\d+)?)$")
+
 
 def parse_monetary_value(value: Optional[str]) -> Optional[float]:
     """
@@ -58,7 +65,7 @@ def parse_monetary_value(value: Optional[str]) -> Optional[float]:
 
     # Remove commas, then find the first run of digits (with optional decimal)
     cleaned = value.replace(",", "")
-    match = re.search(r"[\d]+(?:\.\d+)?", cleaned)
+    match = _MONEY_RE.search(cleaned)
     if not match:
         logger.debug("parse_monetary_value: no numeric content in %r", value)
         return None
@@ -105,7 +112,7 @@ def parse_royalty_rate(
         return ""
 
     # Try to extract a percentage number from strings like "8% of net sales" or "8%"
-    match = re.search(r"([\d]+(?:\.\d+)?)\s*%", rate_str)
+    match = _PERCENT_RE.search(rate_str)
     if match:
         try:
             return float(match.group(1))
@@ -113,7 +120,7 @@ def parse_royalty_rate(
             pass
 
     # Try bare numbers like "8.5" (no percent sign)
-    match = re.match(r"^([\d]+(?:\.\d+)?)$", rate_str)
+    match = _BARE_NUMBER_RE.match(rate_str)
     if match:
         try:
             return float(match.group(1))
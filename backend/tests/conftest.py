@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for the backend test suite.
+"""
+
+import functools
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import pytest_asyncio
+
+
+@functools.lru_cache(maxsize=1)
+def _get_app():
+    """
+    Import and return the FastAPI app, once per test session.
+
+    Imported lazily so test modules can set the Supabase env vars they need
+    before app.db is first imported.
+    """
+    from app.main import app
+    return app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """
+    Session-scoped httpx.AsyncClient that calls the app in-process.
+
+    The app and its route schemas are built once, and tests patch
+    dependencies per request rather than on the client. Requests run on the
+    session event loop instead of through TestClient's per-request thread
+    portal, so tests using it must run on the session loop too: mark them
+    with pytest.mark.asyncio(loop_scope="session").
+    """
+    transport = httpx.ASGITransport(app=_get_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
+
+
+@pytest.fixture(autouse=True)
+def _clear_dependency_overrides():
+    """Drop any app.dependency_overrides a test installed."""
+    yield
+    if _get_app.cache_info().currsize:
+        _get_app().dependency_overrides.clear()
+
+
+# One mock Anthropic client shared by the Claude-backed service tests:
+# anthropic.Anthropic is patched once per module and each test only
+# configures messages.create on the reset client.
+_CLAUDE_CLIENT = MagicMock()
+
+
+@pytest.fixture(scope="module")
+def _patched_anthropic():
+    """Patch anthropic.Anthropic once per module to return _CLAUDE_CLIENT."""
+    with patch("anthropic.Anthropic", return_value=_CLAUDE_CLIENT) as anthropic_cls:
+        yield anthropic_cls
+
+
+@pytest.fixture
+def mock_client(_patched_anthropic):
+    """The shared mock Anthropic client, reset before every test."""
+    _CLAUDE_CLIENT.reset_mock(return_value=True, side_effect=True)
+    return _CLAUDE_CLIENT
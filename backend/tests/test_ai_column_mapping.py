@@ -10,7 +10,8 @@ TDD: tests were written before the implementation.
 import json
 import os
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 # Ensure env vars are set before importing anything that triggers app imports
 os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
@@ -23,12 +24,9 @@ os.environ.setdefault("ANTHROPIC_API_KEY", "test-anthropic-key")
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _make_claude_response(content: str) -> MagicMock:
-    """Build a mock Anthropic message response with the given text content."""
-    response = MagicMock()
-    response.content = [MagicMock()]
-    response.content[0].text = content
-    return response
+def _make_claude_response(content: str) -> SimpleNamespace:
+    """Build a fake Anthropic message response with the given text content."""
+    return SimpleNamespace(content=[SimpleNamespace(text=content)])
 
 
 def _make_contract_context(
@@ -52,7 +50,7 @@ def _make_contract_context(
 class TestClaudeSuggestPromptFormat:
     """claude_suggest() builds the correct prompt payload."""
 
-    def test_sends_column_names_and_samples(self):
+    def test_sends_column_names_and_samples(self, mock_client):
         """The prompt must include column names and sample values."""
         from app.services.spreadsheet_parser import claude_suggest
 
@@ -61,45 +59,39 @@ class TestClaudeSuggestPromptFormat:
         ]
         contract_context = _make_contract_context()
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps({"Rev": "net_sales"})
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps({"Rev": "net_sales"})
+        )
 
-            claude_suggest(columns, contract_context)
+        claude_suggest(columns, contract_context)
 
-            assert mock_client.messages.create.called
-            call_kwargs = mock_client.messages.create.call_args
-            # The user message content must contain the column name and samples
-            user_content = call_kwargs[1]["messages"][0]["content"]
-            assert "Rev" in user_content
-            assert "12000" in user_content
+        assert mock_client.messages.create.called
+        call_kwargs = mock_client.messages.create.call_args
+        # The user message content must contain the column name and samples
+        user_content = call_kwargs[1]["messages"][0]["content"]
+        assert "Rev" in user_content
+        assert "12000" in user_content
 
-    def test_sends_valid_fields_list(self):
+    def test_sends_valid_fields_list(self, mock_client):
         """The prompt must tell Claude which field names are valid."""
         from app.services.spreadsheet_parser import claude_suggest, VALID_FIELDS
 
         columns = [{"name": "Amount", "samples": ["100"]}]
         contract_context = _make_contract_context()
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps({"Amount": "net_sales"})
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps({"Amount": "net_sales"})
+        )
 
-            claude_suggest(columns, contract_context)
+        claude_suggest(columns, contract_context)
 
-            call_kwargs = mock_client.messages.create.call_args
-            user_content = call_kwargs[1]["messages"][0]["content"]
-            # At minimum the core fields should appear in the prompt
-            assert "net_sales" in user_content
-            assert "ignore" in user_content
+        call_kwargs = mock_client.messages.create.call_args
+        user_content = call_kwargs[1]["messages"][0]["content"]
+        # At minimum the core fields should appear in the prompt
+        assert "net_sales" in user_content
+        assert "ignore" in user_content
 
-    def test_sends_contract_context(self):
+    def test_sends_contract_context(self, mock_client):
         """The prompt must include contract context (licensee name, royalty base)."""
         from app.services.spreadsheet_parser import claude_suggest
 
@@ -111,38 +103,32 @@ class TestClaudeSuggestPromptFormat:
             categories=["Apparel", "Accessories"],
         )
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps({"Sales": "gross_sales"})
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps({"Sales": "gross_sales"})
+        )
 
-            claude_suggest(columns, contract_context)
+        claude_suggest(columns, contract_context)
 
-            call_kwargs = mock_client.messages.create.call_args
-            user_content = call_kwargs[1]["messages"][0]["content"]
-            assert "Sunrise Apparel" in user_content
+        call_kwargs = mock_client.messages.create.call_args
+        user_content = call_kwargs[1]["messages"][0]["content"]
+        assert "Sunrise Apparel" in user_content
 
-    def test_uses_non_streaming_call(self):
+    def test_uses_non_streaming_call(self, mock_client):
         """claude_suggest() must NOT use streaming (stream=True)."""
         from app.services.spreadsheet_parser import claude_suggest
 
         columns = [{"name": "Rev", "samples": ["100"]}]
         contract_context = _make_contract_context()
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps({"Rev": "net_sales"})
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps({"Rev": "net_sales"})
+        )
 
-            claude_suggest(columns, contract_context)
+        claude_suggest(columns, contract_context)
 
-            call_kwargs = mock_client.messages.create.call_args
-            # stream kwarg must not be True
-            assert call_kwargs[1].get("stream") is not True
+        call_kwargs = mock_client.messages.create.call_args
+        # stream kwarg must not be True
+        assert call_kwargs[1].get("stream") is not True
 
 
 # ---------------------------------------------------------------------------
@@ -152,7 +138,7 @@ class TestClaudeSuggestPromptFormat:
 class TestClaudeSuggestResponseParsing:
     """claude_suggest() parses Claude's JSON response correctly."""
 
-    def test_returns_mapping_for_valid_fields(self):
+    def test_returns_mapping_for_valid_fields(self, mock_client):
         """Valid field names in the Claude response are returned as-is."""
         from app.services.spreadsheet_parser import claude_suggest
 
@@ -164,18 +150,15 @@ class TestClaudeSuggestResponseParsing:
 
         ai_response = {"Rev": "net_sales", "Sku Group": "product_category"}
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps(ai_response)
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps(ai_response)
+        )
 
-            result = claude_suggest(columns, contract_context)
+        result = claude_suggest(columns, contract_context)
 
         assert result == {"Rev": "net_sales", "Sku Group": "product_category"}
 
-    def test_discards_invalid_field_names(self):
+    def test_discards_invalid_field_names(self, mock_client):
         """Field values that are not in VALID_FIELDS are silently discarded."""
         from app.services.spreadsheet_parser import claude_suggest
 
@@ -188,21 +171,18 @@ class TestClaudeSuggestResponseParsing:
         # Claude returns an invalid field name for "Misc"
         ai_response = {"Rev": "net_sales", "Misc": "bad_field_name"}
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps(ai_response)
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps(ai_response)
+        )
 
-            result = claude_suggest(columns, contract_context)
+        result = claude_suggest(columns, contract_context)
 
         assert "Rev" in result
         assert result["Rev"] == "net_sales"
         # "Misc" was discarded because "bad_field_name" is not valid
         assert "Misc" not in result
 
-    def test_handles_markdown_fenced_json(self):
+    def test_handles_markdown_fenced_json(self, mock_client):
         """Claude sometimes wraps JSON in markdown code fences — strip them."""
         from app.services.spreadsheet_parser import claude_suggest
 
@@ -211,30 +191,24 @@ class TestClaudeSuggestResponseParsing:
 
         fenced = "```json\n{\"Revenue\": \"net_sales\"}\n```"
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(fenced)
+        mock_client.messages.create.return_value = _make_claude_response(fenced)
 
-            result = claude_suggest(columns, contract_context)
+        result = claude_suggest(columns, contract_context)
 
         assert result == {"Revenue": "net_sales"}
 
-    def test_returns_empty_dict_on_invalid_json(self):
+    def test_returns_empty_dict_on_invalid_json(self, mock_client):
         """If Claude returns non-parseable text, return an empty dict (silent fallback)."""
         from app.services.spreadsheet_parser import claude_suggest
 
         columns = [{"name": "Rev", "samples": ["100"]}]
         contract_context = _make_contract_context()
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                "I cannot determine the column mapping."
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            "I cannot determine the column mapping."
+        )
 
-            result = claude_suggest(columns, contract_context)
+        result = claude_suggest(columns, contract_context)
 
         assert result == {}
 
@@ -246,7 +220,7 @@ class TestClaudeSuggestResponseParsing:
 class TestClaudeSuggestFallback:
     """claude_suggest() falls back silently on errors and timeouts."""
 
-    def test_returns_empty_dict_on_timeout(self):
+    def test_returns_empty_dict_on_timeout(self, mock_client):
         """A timeout exception from the Anthropic client returns an empty dict."""
         import httpx
         from app.services.spreadsheet_parser import claude_suggest
@@ -254,30 +228,24 @@ class TestClaudeSuggestFallback:
         columns = [{"name": "Rev", "samples": ["100"]}]
         contract_context = _make_contract_context()
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.side_effect = httpx.TimeoutException(
-                "Request timed out"
-            )
+        mock_client.messages.create.side_effect = httpx.TimeoutException(
+            "Request timed out"
+        )
 
-            result = claude_suggest(columns, contract_context)
+        result = claude_suggest(columns, contract_context)
 
         assert result == {}
 
-    def test_returns_empty_dict_on_api_error(self):
+    def test_returns_empty_dict_on_api_error(self, mock_client):
         """Any exception from the Anthropic client returns an empty dict."""
         from app.services.spreadsheet_parser import claude_suggest
 
         columns = [{"name": "Rev", "samples": ["100"]}]
         contract_context = _make_contract_context()
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.side_effect = Exception("API rate limit exceeded")
+        mock_client.messages.create.side_effect = Exception("API rate limit exceeded")
 
-            result = claude_suggest(columns, contract_context)
+        result = claude_suggest(columns, contract_context)
 
         assert result == {}
 
@@ -295,7 +263,7 @@ class TestClaudeSuggestFallback:
 
         assert result == {}
 
-    def test_returns_empty_dict_when_no_api_key(self):
+    def test_returns_empty_dict_when_no_api_key(self, mock_client):
         """When ANTHROPIC_API_KEY is not set, return empty dict (no crash)."""
         from app.services.spreadsheet_parser import claude_suggest
 
@@ -308,12 +276,9 @@ class TestClaudeSuggestFallback:
                 k: v for k, v in os.environ.items() if k != "ANTHROPIC_API_KEY"
             }
             with patch.dict(os.environ, env_without_key, clear=True):
-                with patch("anthropic.Anthropic") as MockAnthropic:
-                    mock_client = MagicMock()
-                    MockAnthropic.return_value = mock_client
-                    mock_client.messages.create.side_effect = Exception("No API key")
+                mock_client.messages.create.side_effect = Exception("No API key")
 
-                    result = claude_suggest(columns, contract_context)
+                result = claude_suggest(columns, contract_context)
 
         assert result == {}
 
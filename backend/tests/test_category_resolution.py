@@ -17,6 +17,7 @@ import json
 import os
 import pytest
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 # Ensure env vars are set before importing anything that triggers app imports
@@ -43,12 +44,9 @@ def _make_xlsx_bytes(rows: list[list]) -> bytes:
     return buf.read()
 
 
-def _make_claude_response(content: str) -> MagicMock:
-    """Build a mock Anthropic message response with the given text content."""
-    response = MagicMock()
-    response.content = [MagicMock()]
-    response.content[0].text = content
-    return response
+def _make_claude_response(content: str) -> SimpleNamespace:
+    """Build a fake Anthropic message response with the given text content."""
+    return SimpleNamespace(content=[SimpleNamespace(text=content)])
 
 
 def _make_db_contract(
@@ -167,7 +165,7 @@ def _mock_periods_table(insert_result):
 class TestClaudeSuggestCategories:
     """claude_suggest_categories() calls Claude and parses the response."""
 
-    def test_returns_mapping_for_valid_contract_categories(self):
+    def test_returns_mapping_for_valid_contract_categories(self, mock_client):
         """Claude's mapping is returned when all suggested categories are valid."""
         from app.services.spreadsheet_parser import claude_suggest_categories
 
@@ -180,20 +178,17 @@ class TestClaudeSuggestCategories:
             "Footwear": "Footwear",
         }
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps(ai_response)
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps(ai_response)
+        )
 
-            result = claude_suggest_categories(report_categories, contract_categories)
+        result = claude_suggest_categories(report_categories, contract_categories)
 
         assert result["Tops & Bottoms"] == "Apparel"
         assert result["Hard Accessories"] == "Accessories"
         assert result["Footwear"] == "Footwear"
 
-    def test_discards_suggestions_not_in_contract_categories(self):
+    def test_discards_suggestions_not_in_contract_categories(self, mock_client):
         """Suggested categories that are not in contract_categories are discarded."""
         from app.services.spreadsheet_parser import claude_suggest_categories
 
@@ -206,20 +201,17 @@ class TestClaudeSuggestCategories:
             "Electronics": "Gadgets",  # not a real contract category
         }
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps(ai_response)
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps(ai_response)
+        )
 
-            result = claude_suggest_categories(report_categories, contract_categories)
+        result = claude_suggest_categories(report_categories, contract_categories)
 
         assert result["Tops & Bottoms"] == "Apparel"
         # "Electronics" -> "Gadgets" discarded because "Gadgets" not in contract
         assert "Electronics" not in result
 
-    def test_handles_markdown_fenced_json(self):
+    def test_handles_markdown_fenced_json(self, mock_client):
         """Claude sometimes wraps JSON in markdown code fences — strip them."""
         from app.services.spreadsheet_parser import claude_suggest_categories
 
@@ -228,91 +220,73 @@ class TestClaudeSuggestCategories:
 
         fenced = '```json\n{"Tops": "Apparel"}\n```'
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(fenced)
+        mock_client.messages.create.return_value = _make_claude_response(fenced)
 
-            result = claude_suggest_categories(report_categories, contract_categories)
+        result = claude_suggest_categories(report_categories, contract_categories)
 
         assert result == {"Tops": "Apparel"}
 
-    def test_returns_empty_dict_on_invalid_json(self):
+    def test_returns_empty_dict_on_invalid_json(self, mock_client):
         """If Claude returns non-parseable text, return an empty dict."""
         from app.services.spreadsheet_parser import claude_suggest_categories
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                "I cannot determine the mapping."
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            "I cannot determine the mapping."
+        )
 
-            result = claude_suggest_categories(["Tops"], ["Apparel"])
+        result = claude_suggest_categories(["Tops"], ["Apparel"])
 
         assert result == {}
 
-    def test_returns_empty_dict_on_timeout(self):
+    def test_returns_empty_dict_on_timeout(self, mock_client):
         """A timeout exception returns an empty dict (silent fallback)."""
         import httpx
         from app.services.spreadsheet_parser import claude_suggest_categories
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.side_effect = httpx.TimeoutException("timeout")
+        mock_client.messages.create.side_effect = httpx.TimeoutException("timeout")
 
-            result = claude_suggest_categories(["Tops"], ["Apparel"])
+        result = claude_suggest_categories(["Tops"], ["Apparel"])
 
         assert result == {}
 
-    def test_returns_empty_dict_on_api_error(self):
+    def test_returns_empty_dict_on_api_error(self, mock_client):
         """Any exception from the Anthropic client returns an empty dict."""
         from app.services.spreadsheet_parser import claude_suggest_categories
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.side_effect = Exception("API error")
+        mock_client.messages.create.side_effect = Exception("API error")
 
-            result = claude_suggest_categories(["Tops"], ["Apparel"])
+        result = claude_suggest_categories(["Tops"], ["Apparel"])
 
         assert result == {}
 
-    def test_returns_empty_dict_when_report_categories_empty(self):
+    def test_returns_empty_dict_when_report_categories_empty(self, mock_client):
         """If report_categories is empty, return {} without calling Claude."""
         from app.services.spreadsheet_parser import claude_suggest_categories
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
 
-            result = claude_suggest_categories([], ["Apparel"])
+        result = claude_suggest_categories([], ["Apparel"])
 
         assert result == {}
         assert not mock_client.messages.create.called
 
-    def test_prompt_contains_report_and_contract_categories(self):
+    def test_prompt_contains_report_and_contract_categories(self, mock_client):
         """The prompt includes both report categories and contract categories."""
         from app.services.spreadsheet_parser import claude_suggest_categories
 
         report_categories = ["Tops & Bottoms"]
         contract_categories = ["Apparel", "Accessories"]
 
-        with patch("anthropic.Anthropic") as MockAnthropic:
-            mock_client = MagicMock()
-            MockAnthropic.return_value = mock_client
-            mock_client.messages.create.return_value = _make_claude_response(
-                json.dumps({"Tops & Bottoms": "Apparel"})
-            )
+        mock_client.messages.create.return_value = _make_claude_response(
+            json.dumps({"Tops & Bottoms": "Apparel"})
+        )
 
-            claude_suggest_categories(report_categories, contract_categories)
+        claude_suggest_categories(report_categories, contract_categories)
 
-            call_kwargs = mock_client.messages.create.call_args
-            user_content = call_kwargs[1]["messages"][0]["content"]
-            assert "Tops & Bottoms" in user_content
-            assert "Apparel" in user_content
-            assert "Accessories" in user_content
+        call_kwargs = mock_client.messages.create.call_args
+        user_content = call_kwargs[1]["messages"][0]["content"]
+        assert "Tops & Bottoms" in user_content
+        assert "Apparel" in user_content
+        assert "Accessories" in user_content
 
 
 # ---------------------------------------------------------------------------
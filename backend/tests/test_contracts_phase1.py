@@ -5,16 +5,40 @@ status filter, and storage deterministic paths.
 TDD: tests written first, implementation follows.
 """
 
+import json
 import pytest
 import os
+import re
+from datetime import date
+from decimal import Decimal
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from fastapi import HTTPException
+from fastapi import HTTPException, UploadFile
+from pydantic import ValidationError
 
 # Mock environment variables before importing app modules
 os.environ['SUPABASE_URL'] = 'https://test.supabase.co'
 os.environ['SUPABASE_KEY'] = 'test-anon-key'
 os.environ['SUPABASE_SERVICE_KEY'] = 'test-service-key'
 
+from app.models.contract import (
+    Contract,
+    ContractConfirm,
+    ContractDraftCreate,
+    ContractStatus,
+    ContractWithFormValues,
+    ExtractedTerms,
+    MinimumGuaranteePeriod,
+    ReportingFrequency,
+    RoyaltyTier,
+)
+from app.routers.contracts import (
+    confirm_contract,
+    extract_contract_terms,
+    get_contract,
+    list_contracts,
+)
+from app.services.storage import upload_contract_pdf
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -80,15 +104,12 @@ class TestContractStatusEnum:
     """ContractStatus enum has draft and active values."""
 
     def test_draft_value(self):
-        from app.models.contract import ContractStatus
         assert ContractStatus.DRAFT == "draft"
 
     def test_active_value(self):
-        from app.models.contract import ContractStatus
         assert ContractStatus.ACTIVE == "active"
 
     def test_is_str_enum(self):
-        from app.models.contract import ContractStatus
         assert isinstance(ContractStatus.DRAFT, str)
         assert isinstance(ContractStatus.ACTIVE, str)
 
@@ -97,7 +118,6 @@ class TestContractDraftCreate:
     """ContractDraftCreate model for draft insertion at extraction time."""
 
     def test_required_fields(self):
-        from app.models.contract import ContractDraftCreate, ExtractedTerms, ContractStatus
         draft = ContractDraftCreate(
             filename="Nike_License_2024.pdf",
             pdf_url="https://example.com/contract.pdf",
@@ -110,7 +130,6 @@ class TestContractDraftCreate:
         assert draft.status == ContractStatus.DRAFT
 
     def test_status_defaults_to_draft(self):
-        from app.models.contract import ContractDraftCreate, ExtractedTerms, ContractStatus
         draft = ContractDraftCreate(
             filename="test.pdf",
             pdf_url="https://example.com/test.pdf",
@@ -124,9 +143,6 @@ class TestContractConfirm:
     """ContractConfirm model for the PUT /{id}/confirm endpoint."""
 
     def test_required_fields(self):
-        from app.models.contract import ContractConfirm
-        from datetime import date
-
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
             royalty_rate="8% of Net Sales",
@@ -137,10 +153,6 @@ class TestContractConfirm:
         assert confirm.royalty_rate == "8% of Net Sales"
 
     def test_optional_fields_have_defaults(self):
-        from app.models.contract import ContractConfirm, MinimumGuaranteePeriod, ReportingFrequency
-        from datetime import date
-        from decimal import Decimal
-
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
             royalty_rate="8% of Net Sales",
@@ -157,8 +169,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_coerces_float_to_string(self):
         """A plain float royalty_rate (e.g. 0.10) is coerced to a '0.1%' string."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -170,8 +180,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_coerces_int_to_string(self):
         """A plain integer royalty_rate (e.g. 10) is coerced to '10%'."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -183,8 +191,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_string_passes_through_unchanged(self):
         """A pre-formatted string royalty_rate is not modified by the validator."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -196,8 +202,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_large_float_coerced(self):
         """A percentage-style float (e.g. 10.5) is coerced to '10.5%'."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -209,8 +213,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_bare_integer_string_coerced(self):
         """A bare integer string (e.g. '8') is coerced to '8%'."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -222,8 +224,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_bare_decimal_string_coerced(self):
         """A bare decimal string (e.g. '10.5') is coerced to '10.5%'."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -235,8 +235,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_bare_fraction_string_coerced(self):
         """A bare fractional string (e.g. '0.1') is coerced to '0.1%'."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -248,8 +246,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_string_with_percent_unchanged(self):
         """A string already containing '%' is not double-suffixed."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -261,8 +257,6 @@ class TestContractConfirm:
 
     def test_royalty_rate_descriptive_string_unchanged(self):
         """A descriptive string without a bare number is returned unchanged."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -274,8 +268,6 @@ class TestContractConfirm:
 
     def test_dates_are_required(self):
         """contract_start_date and contract_end_date must be provided."""
-        from app.models.contract import ContractConfirm
-        from pydantic import ValidationError
 
         with pytest.raises(ValidationError) as exc_info:
             ContractConfirm(
@@ -292,7 +284,6 @@ class TestContractModelNullableFields:
     """Contract response model accommodates nullable fields for drafts."""
 
     def test_contract_has_status_field(self):
-        from app.models.contract import Contract, ContractStatus
         # Build with all required fields
         contract = Contract(
             id="c-1",
@@ -307,7 +298,6 @@ class TestContractModelNullableFields:
         assert contract.status == ContractStatus.ACTIVE
 
     def test_contract_has_filename_field(self):
-        from app.models.contract import Contract, ContractStatus
         contract = Contract(
             id="c-1",
             user_id="u-1",
@@ -321,7 +311,6 @@ class TestContractModelNullableFields:
         assert contract.filename == "Nike_License_2024.pdf"
 
     def test_contract_filename_can_be_none(self):
-        from app.models.contract import Contract, ContractStatus
         contract = Contract(
             id="c-1",
             user_id="u-1",
@@ -336,7 +325,6 @@ class TestContractModelNullableFields:
 
     def test_contract_licensee_name_can_be_none(self):
         """Draft contracts have no licensee_name yet."""
-        from app.models.contract import Contract, ContractStatus
         contract = Contract(
             id="c-1",
             user_id="u-1",
@@ -351,7 +339,6 @@ class TestContractModelNullableFields:
         assert contract.licensee_name is None
 
     def test_contract_royalty_rate_can_be_none(self):
-        from app.models.contract import Contract, ContractStatus
         contract = Contract(
             id="c-1",
             user_id="u-1",
@@ -375,7 +362,6 @@ class TestStorageDeterministicPath:
 
     def test_upload_uses_deterministic_path(self):
         """Storage path is contracts/{user_id}/{sanitized_filename} — no UUID prefix."""
-        from app.services.storage import upload_contract_pdf
 
         file_content = b"fake pdf content"
         user_id = "user-123"
@@ -390,7 +376,6 @@ class TestStorageDeterministicPath:
 
     def test_upload_sanitizes_filename_spaces(self):
         """Spaces and special chars are replaced with underscores in the path."""
-        from app.services.storage import upload_contract_pdf
 
         file_content = b"fake pdf content"
         user_id = "user-123"
@@ -409,7 +394,6 @@ class TestStorageDeterministicPath:
 
     def test_upload_uses_upsert_true(self):
         """Upload options must include upsert: true so re-uploads overwrite orphaned files."""
-        from app.services.storage import upload_contract_pdf
 
         file_content = b"fake pdf content"
         user_id = "user-123"
@@ -426,8 +410,6 @@ class TestStorageDeterministicPath:
 
     def test_upload_no_uuid_prefix_in_path(self):
         """The storage path must NOT start with a UUID hex before the filename."""
-        from app.services.storage import upload_contract_pdf
-        import re
 
         file_content = b"fake pdf content"
         user_id = "user-123"
@@ -451,7 +433,6 @@ class TestStorageExistingTests:
 
     def test_successful_upload_returns_exact_path(self):
         """Upload with filename returns exact deterministic path (no UUID suffix)."""
-        from app.services.storage import upload_contract_pdf
 
         file_content = b"fake pdf content"
         user_id = "user-123"
@@ -477,8 +458,6 @@ class TestExtractDuplicateCheck:
     @pytest.mark.asyncio
     async def test_409_duplicate_filename_for_active_contract(self):
         """Active contract with same filename → 409 DUPLICATE_FILENAME."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -508,8 +487,6 @@ class TestExtractDuplicateCheck:
     @pytest.mark.asyncio
     async def test_409_incomplete_draft_for_draft_contract(self):
         """Draft contract with same filename → 409 INCOMPLETE_DRAFT."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -540,8 +517,6 @@ class TestExtractDuplicateCheck:
     @pytest.mark.asyncio
     async def test_no_duplicate_check_proceeds_to_extraction(self):
         """No matching filename → upload and extract as normal."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -586,8 +561,6 @@ class TestExtractDuplicateCheck:
         The ilike query is passed the filename as-is and Postgres handles case.
         We simulate the DB returning a match even for mixed-case input.
         """
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -613,8 +586,6 @@ class TestExtractDuplicateCheck:
     @pytest.mark.asyncio
     async def test_duplicate_check_uses_ilike_query(self):
         """The duplicate check query uses ilike for case-insensitive filename matching."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -668,8 +639,6 @@ class TestExtractDraftInsertion:
     @pytest.mark.asyncio
     async def test_extract_inserts_draft_row(self):
         """After extraction, a draft row is inserted into contracts table."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -716,8 +685,6 @@ class TestExtractDraftInsertion:
     @pytest.mark.asyncio
     async def test_extract_response_includes_contract_id(self):
         """Response from /extract includes contract_id of the new draft."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -756,8 +723,6 @@ class TestExtractDraftInsertion:
     @pytest.mark.asyncio
     async def test_extract_cleans_up_storage_on_extraction_failure(self):
         """If extraction fails after upload, the storage file is deleted (best-effort)."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -788,8 +753,6 @@ class TestExtractDraftInsertion:
     @pytest.mark.asyncio
     async def test_extract_draft_insert_failure_raises_500(self):
         """If draft insert fails after extraction, a 500 is raised."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -832,9 +795,6 @@ class TestConfirmEndpoint:
     @pytest.mark.asyncio
     async def test_confirm_promotes_draft_to_active(self):
         """Confirming a draft contract sets status='active' and populates fields."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         contract_id = "draft-123"
         user_id = "user-123"
@@ -869,9 +829,6 @@ class TestConfirmEndpoint:
     @pytest.mark.asyncio
     async def test_confirm_returns_contract_model(self):
         """PUT /{id}/confirm returns the updated Contract model."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm, Contract
-        from datetime import date
 
         contract_id = "draft-123"
         user_id = "user-123"
@@ -902,9 +859,6 @@ class TestConfirmEndpoint:
     @pytest.mark.asyncio
     async def test_confirm_returns_409_if_already_active(self):
         """Confirming an already-active contract returns 409."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         contract_id = "active-contract-123"
         user_id = "user-123"
@@ -930,9 +884,6 @@ class TestConfirmEndpoint:
     @pytest.mark.asyncio
     async def test_confirm_returns_404_if_contract_not_found(self):
         """Confirming a non-existent contract returns 404."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm_data = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -959,10 +910,6 @@ class TestConfirmEndpoint:
         contain plain dicts (not Pydantic model instances) so that supabase-py can
         JSON-serialize the payload with json.dumps() without a TypeError.
         """
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm, RoyaltyTier
-        from datetime import date
-        import json
 
         contract_id = "draft-tiered-123"
         user_id = "user-123"
@@ -1017,10 +964,6 @@ class TestConfirmEndpoint:
         When royalty_rate is a flat string like '8%', the update payload must
         contain a plain string (model_dump() does not alter strings).
         """
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
-        import json
 
         contract_id = "draft-flat-123"
         user_id = "user-123"
@@ -1055,9 +998,6 @@ class TestConfirmEndpoint:
     @pytest.mark.asyncio
     async def test_confirm_verifies_ownership(self):
         """PUT /{id}/confirm calls verify_contract_ownership."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm_data = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -1090,7 +1030,6 @@ class TestListContractsStatusFilter:
     @pytest.mark.asyncio
     async def test_list_returns_only_active_by_default(self):
         """Default GET / returns only active contracts."""
-        from app.routers.contracts import list_contracts
 
         active_1 = _make_db_contract(contract_id="a-1", status="active")
         active_2 = _make_db_contract(contract_id="a-2", status="active")
@@ -1112,7 +1051,6 @@ class TestListContractsStatusFilter:
     @pytest.mark.asyncio
     async def test_list_returns_all_statuses_when_include_drafts_true(self):
         """GET /?include_drafts=true returns both active and draft contracts."""
-        from app.routers.contracts import list_contracts
 
         active_row = _make_db_contract(contract_id="a-1", status="active")
         draft_row = _make_draft_db_contract(contract_id="d-1")
@@ -1129,7 +1067,6 @@ class TestListContractsStatusFilter:
     @pytest.mark.asyncio
     async def test_list_include_drafts_false_filters_to_active(self):
         """include_drafts=False must apply an eq('status','active') filter."""
-        from app.routers.contracts import list_contracts
 
         active_row = _make_db_contract(contract_id="a-1", status="active")
 
@@ -1158,8 +1095,6 @@ class Test409ResponseShape:
     @pytest.mark.asyncio
     async def test_duplicate_filename_response_shape(self):
         """DUPLICATE_FILENAME 409 has correct fields."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake"
         mock_file = Mock(spec=UploadFile)
@@ -1194,8 +1129,6 @@ class Test409ResponseShape:
     @pytest.mark.asyncio
     async def test_incomplete_draft_response_shape(self):
         """INCOMPLETE_DRAFT 409 has correct fields (no licensee_name)."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake"
         mock_file = Mock(spec=UploadFile)
@@ -1237,8 +1170,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_draft_includes_form_values(self):
         """Draft contract response includes a non-None form_values field."""
-        from app.routers.contracts import get_contract
-        from app.models.contract import ContractWithFormValues
 
         draft_row = _make_draft_db_contract(
             contract_id="draft-fv-1",
@@ -1271,7 +1202,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_draft_form_values_has_correct_licensee_name(self):
         """form_values.licensee_name is populated from extracted_terms."""
-        from app.routers.contracts import get_contract
 
         draft_row = _make_draft_db_contract(contract_id="draft-fv-2", filename="test.pdf")
         draft_row["extracted_terms"] = {
@@ -1300,7 +1230,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_draft_form_values_normalizes_royalty_rate(self):
         """form_values.royalty_rate is a normalized float, not a raw string."""
-        from app.routers.contracts import get_contract
 
         draft_row = _make_draft_db_contract(contract_id="draft-fv-3", filename="test.pdf")
         draft_row["extracted_terms"] = {
@@ -1329,7 +1258,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_draft_form_values_normalizes_monetary_values(self):
         """form_values.minimum_guarantee is a float parsed from the raw string."""
-        from app.routers.contracts import get_contract
 
         draft_row = _make_draft_db_contract(contract_id="draft-fv-4", filename="test.pdf")
         draft_row["extracted_terms"] = {
@@ -1358,8 +1286,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_active_contract_has_no_form_values(self):
         """Active contracts do not include form_values (it is None)."""
-        from app.routers.contracts import get_contract
-        from app.models.contract import ContractWithFormValues
 
         active_row = _make_db_contract(contract_id="active-1", status="active")
 
@@ -1376,7 +1302,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_draft_form_values_none_when_extracted_terms_empty(self):
         """form_values is None when extracted_terms is empty/missing."""
-        from app.routers.contracts import get_contract
 
         draft_row = _make_draft_db_contract(contract_id="draft-fv-5", filename="test.pdf")
         draft_row["extracted_terms"] = {}  # Empty
@@ -1394,7 +1319,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_contract_returns_404_if_not_found(self):
         """GET /{id} returns 404 if the contract does not exist."""
-        from app.routers.contracts import get_contract
 
         with patch('app.routers.contracts.verify_contract_ownership') as mock_verify:
             # verify_contract_ownership raises 404 when contract not found
@@ -1410,7 +1334,6 @@ class TestGetContractFormValues:
     @pytest.mark.asyncio
     async def test_get_contract_verifies_ownership(self):
         """GET /{id} calls verify_contract_ownership and propagates 403."""
-        from app.routers.contracts import get_contract
 
         with patch('app.routers.contracts.verify_contract_ownership') as mock_verify:
             mock_verify.side_effect = HTTPException(
@@ -1441,8 +1364,6 @@ class TestExtractMobileFilenameRobustness:
     @pytest.mark.asyncio
     async def test_none_filename_with_pdf_content_type_passes(self):
         """filename=None + content_type='application/pdf' → accepted, fallback name generated."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -1486,8 +1407,6 @@ class TestExtractMobileFilenameRobustness:
     @pytest.mark.asyncio
     async def test_uppercase_pdf_extension_passes(self):
         """filename='contract.PDF' (uppercase) → accepted (case-insensitive check)."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -1524,8 +1443,6 @@ class TestExtractMobileFilenameRobustness:
     @pytest.mark.asyncio
     async def test_none_filename_with_non_pdf_content_type_raises_400(self):
         """filename=None + content_type='text/plain' → rejected with 400."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         mock_file = Mock(spec=UploadFile)
         mock_file.filename = None
@@ -1541,8 +1458,6 @@ class TestExtractMobileFilenameRobustness:
     @pytest.mark.asyncio
     async def test_no_extension_with_pdf_content_type_appends_pdf(self):
         """filename='document_123' (no .pdf) + content_type='application/pdf' → .pdf appended."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -1583,8 +1498,6 @@ class TestExtractMobileFilenameRobustness:
     @pytest.mark.asyncio
     async def test_empty_filename_string_treated_as_none(self):
         """filename='' (empty string) with PDF content_type → accepted, fallback name used."""
-        from app.routers.contracts import extract_contract_terms
-        from fastapi import UploadFile
 
         pdf_content = b"%PDF-1.4 fake pdf content"
         mock_file = Mock(spec=UploadFile)
@@ -1642,16 +1555,12 @@ class TestAgreementNumberAndLicenseeEmail:
 
     def test_confirm_model_does_not_have_agreement_number_field(self):
         """ContractConfirm no longer accepts agreement_number from user input."""
-        from app.models.contract import ContractConfirm
         assert not hasattr(ContractConfirm.model_fields, "agreement_number"), (
             "ContractConfirm should not have agreement_number — it is auto-generated"
         )
 
     def test_confirm_model_ignores_extra_agreement_number(self):
         """Passing agreement_number to ContractConfirm is silently ignored (extra field)."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
-        from pydantic import ValidationError
 
         # Pydantic v2 default: extra fields are ignored (not raising an error).
         # The key assertion is that no agreement_number attribute lands on the model.
@@ -1668,8 +1577,6 @@ class TestAgreementNumberAndLicenseeEmail:
 
     def test_confirm_model_accepts_licensee_email(self):
         """ContractConfirm still supports licensee_email as optional."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -1682,8 +1589,6 @@ class TestAgreementNumberAndLicenseeEmail:
 
     def test_confirm_model_licensee_email_defaults_none(self):
         """ContractConfirm.licensee_email defaults to None when omitted."""
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         confirm = ContractConfirm(
             licensee_name="Nike Inc.",
@@ -1699,7 +1604,6 @@ class TestAgreementNumberAndLicenseeEmail:
 
     def test_contract_model_includes_agreement_number(self):
         """Contract response model has agreement_number field (auto-generated value)."""
-        from app.models.contract import Contract
 
         row = {
             "id": "c-1",
@@ -1717,7 +1621,6 @@ class TestAgreementNumberAndLicenseeEmail:
 
     def test_contract_model_agreement_number_defaults_none(self):
         """Contract model agreement_number defaults to None when absent from DB row."""
-        from app.models.contract import Contract
 
         row = {
             "id": "c-1",
@@ -1733,7 +1636,6 @@ class TestAgreementNumberAndLicenseeEmail:
 
     def test_contract_model_includes_licensee_email(self):
         """Contract response model has licensee_email field."""
-        from app.models.contract import Contract
 
         row = {
             "id": "c-1",
@@ -1795,9 +1697,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_confirm_first_contract_gets_seq_1(self):
         """First contract for a user in the current year gets LKH-{year}-1."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         contract_id = "draft-agr-first"
         user_id = "user-123"
@@ -1834,9 +1733,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_confirm_second_contract_gets_seq_2(self):
         """Second contract for a user in the current year gets LKH-{year}-2."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         contract_id = "draft-agr-second"
         user_id = "user-123"
@@ -1874,9 +1770,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_confirm_year_rollover_resets_seq_to_1(self):
         """After a year boundary, the sequence resets: last was LKH-2025-5, new is LKH-2026-1."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         contract_id = "draft-agr-rollover"
         user_id = "user-123"
@@ -1913,9 +1806,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_confirm_generated_number_in_update_payload(self):
         """The auto-generated agreement_number is written to the DB update payload."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         contract_id = "draft-payload-check"
         user_id = "user-123"
@@ -1971,9 +1861,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_confirm_stores_licensee_email(self):
         """PUT /{id}/confirm passes licensee_email to the DB update."""
-        from app.routers.contracts import confirm_contract
-        from app.models.contract import ContractConfirm
-        from datetime import date
 
         contract_id = "draft-email-1"
         user_id = "user-123"
@@ -2032,8 +1919,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_get_contract_returns_agreement_number(self):
         """GET /{id} returns the auto-generated agreement_number in the contract detail."""
-        from app.routers.contracts import get_contract
-        from datetime import date
 
         current_year = date.today().year
         active_row = {
@@ -2054,7 +1939,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_get_contract_agreement_number_none_when_absent(self):
         """GET /{id} returns agreement_number=None when not set on the contract."""
-        from app.routers.contracts import get_contract
 
         active_row = {
             **_make_db_contract(contract_id="c-no-agr-1", status="active"),
@@ -2077,8 +1961,6 @@ class TestAgreementNumberAndLicenseeEmail:
     @pytest.mark.asyncio
     async def test_list_contracts_returns_agreement_number(self):
         """GET / includes agreement_number and licensee_email in each contract row."""
-        from app.routers.contracts import list_contracts
-        from datetime import date
 
         current_year = date.today().year
         row = {
@@ -14,6 +14,9 @@ os.environ['SUPABASE_URL'] = 'https://test.supabase.co'
 os.environ['SUPABASE_KEY'] = 'test-anon-key'
 os.environ['SUPABASE_SERVICE_KEY'] = 'test-service-key'
 
+from app.models.contract import Contract
+from app.models.sales import SalesPeriod
+
 
 # ---------------------------------------------------------------------------
 # CORS configuration tests
@@ -280,7 +283,6 @@ class TestContractIsExpired:
     """Contract.is_expired is True when contract_end_date is in the past."""
 
     def _make_contract(self, end_date=None, **kwargs):
-        from app.models.contract import Contract
         base = {
             "id": "c-1",
             "user_id": "u-1",
@@ -343,7 +345,6 @@ class TestDaysUntilReportDue:
     """
 
     def _make_contract(self, reporting_frequency=None, contract_start_date=None, **kwargs):
-        from app.models.contract import Contract
         base = {
             "id": "c-1",
             "user_id": "u-1",
@@ -439,7 +440,6 @@ class TestDecimalSerialization:
 
     def test_minimum_guarantee_serializes_to_string(self):
         """Decimal minimum_guarantee appears as a numeric string in JSON."""
-        from app.models.contract import Contract
         from decimal import Decimal
 
         contract = Contract(
@@ -456,7 +456,6 @@ class TestDecimalSerialization:
 
     def test_advance_payment_serializes_to_string(self):
         """Decimal advance_payment appears as a numeric string in JSON."""
-        from app.models.contract import Contract
         from decimal import Decimal
 
         contract = Contract(
@@ -473,7 +472,6 @@ class TestDecimalSerialization:
 
     def test_null_decimal_fields_serialize_as_null(self):
         """Optional Decimal fields that are None serialize as null in JSON."""
-        from app.models.contract import Contract
 
         contract = Contract(
             id="c-1",
@@ -489,7 +487,6 @@ class TestDecimalSerialization:
 
     def test_sales_period_decimals_serialize(self):
         """SalesPeriod Decimal fields serialize correctly."""
-        from app.models.sales import SalesPeriod
         from decimal import Decimal
 
         sp = SalesPeriod(
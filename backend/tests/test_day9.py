@@ -465,7 +465,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_returns_summary_with_zero_minimum(self):
         """Returns a complete RoyaltySummary for a contract with no minimum guarantee."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(
@@ -503,7 +502,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_returns_summary_with_annual_minimum_shortfall(self):
         """Returns shortfall when total royalties < annual minimum guarantee."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(
@@ -530,7 +528,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_returns_summary_with_advance_remaining(self):
         """Advance remaining is correctly reported in Year 1."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(
@@ -556,7 +553,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_returns_zero_advance_remaining_in_year_2(self):
         """Advance credit does not apply in Year 2+."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(
@@ -581,7 +577,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_returns_empty_summary_when_no_periods(self):
         """Returns zero totals when no sales periods exist for the contract."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(minimum_guarantee="0", advance_payment=None)
@@ -602,7 +597,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_raises_404_when_contract_not_found(self):
         """Returns 404 when the contract does not exist."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             # Contract query returns empty data
@@ -628,7 +622,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_summary_updated_at_is_populated(self):
         """summary.updated_at is an ISO timestamp string."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(minimum_guarantee="0", advance_payment=None)
@@ -650,7 +643,6 @@ class TestGetRoyaltySummaryEndpoint:
     async def test_multiple_periods_summed_correctly(self):
         """All sales periods for the contract year are aggregated."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(minimum_guarantee="0", advance_payment=None)
@@ -713,7 +705,6 @@ class TestCreateSalesPeriodWithMinimum:
     async def test_minimum_applied_flag_set_when_below_quarterly_floor(self):
         """minimum_applied=True is stored when royalty < quarterly minimum."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(
@@ -751,7 +742,6 @@ class TestCreateSalesPeriodWithMinimum:
     async def test_minimum_not_applied_when_above_quarterly_floor(self):
         """minimum_applied=False when calculated royalty >= quarterly minimum."""
         with patch('app.routers.sales.supabase') as mock_supabase, \
-             patch('app.auth.get_current_user', return_value="user-123"), \
              patch('app.routers.sales.verify_contract_ownership', new_callable=AsyncMock):
 
             contract = _make_db_contract(
@@ -27,8 +27,6 @@ os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
 # X-Postmark-Secret will also work because the auth dependency checks both.
 os.environ.setdefault("INBOUND_WEBHOOK_SECRET", "test-webhook-secret")
 
-from fastapi.testclient import TestClient
-
 
 # ---------------------------------------------------------------------------
 # Payload builder helpers
@@ -152,10 +150,10 @@ def _make_db_inbound_report(
 
 def _make_supabase_chain(*results):
     """
-    Build a MagicMock that returns results[i] from the i-th .execute() call,
+    Build a Mock that returns results[i] from the i-th .execute() call,
     regardless of which chaining methods (.eq, .select, .insert, etc.) were called.
     """
-    mock = MagicMock()
+    mock = Mock()
     mock.select.return_value = mock
     mock.eq.return_value = mock
     mock.insert.return_value = mock
@@ -174,59 +172,45 @@ def _make_supabase_chain(*results):
 def _make_webhook_table_side_effect(user_id, contract_data, report_row):
     """Return a table() side-effect that covers the three webhook DB calls."""
 
-    users_mock = MagicMock()
+    users_mock = Mock()
     users_mock.execute.return_value = Mock(data=[_make_db_user(user_id)])
     users_mock.ilike.return_value = users_mock
     users_mock.select.return_value = users_mock
 
-    contracts_mock = MagicMock()
+    contracts_mock = Mock()
     contracts_mock.execute.return_value = Mock(data=contract_data)
     contracts_mock.eq.return_value = contracts_mock
     contracts_mock.select.return_value = contracts_mock
 
-    insert_mock = MagicMock()
+    insert_mock = Mock()
     insert_mock.execute.return_value = Mock(data=[report_row])
 
-    def side_effect(name):
-        if name == "users":
-            return users_mock
-        if name == "contracts":
-            return contracts_mock
-        if name == "inbound_reports":
-            t = MagicMock()
-            t.insert.return_value = insert_mock
-            return t
-        return MagicMock()
-
-    return side_effect
-
+    reports_table = Mock()
+    reports_table.insert.return_value = insert_mock
 
-# ---------------------------------------------------------------------------
-# App fixture
-# ---------------------------------------------------------------------------
-
-@pytest.fixture()
-def client():
-    """Return a TestClient for the FastAPI app with Supabase fully mocked."""
-    from app.main import app
-    return TestClient(app)
+    return {
+        "users": users_mock,
+        "contracts": contracts_mock,
+        "inbound_reports": reports_table,
+    }.get
 
 
 # ===========================================================================
 # GET /api/email-intake/inbound-address
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestGetInboundAddress:
     """GET /api/email-intake/inbound-address returns user's inbound email."""
 
-    def test_returns_inbound_address_for_authenticated_user(self, client):
+    async def test_returns_inbound_address_for_authenticated_user(self, async_client):
         user_id = "abcd1234-ef00-0000-0000-000000000000"
         expected_short_id = "abcd1234"
 
         with patch("app.auth.supabase") as mock_auth_sb:
             mock_auth_sb.auth.get_user.return_value = Mock(user=Mock(id=user_id))
 
-            response = client.get(
+            response = await async_client.get(
                 "/api/email-intake/inbound-address",
                 headers={"Authorization": "Bearer test-token"},
             )
@@ -236,8 +220,8 @@ class TestGetInboundAddress:
         assert data["inbound_address"] == f"reports-{expected_short_id}@inbound.likha.app"
         assert data["user_id"] == user_id
 
-    def test_requires_auth(self, client):
-        response = client.get("/api/email-intake/inbound-address")
+    async def test_requires_auth(self, async_client):
+        response = await async_client.get("/api/email-intake/inbound-address")
         assert response.status_code == 401
 
 
@@ -245,28 +229,29 @@ class TestGetInboundAddress:
 # POST /api/email-intake/inbound  — webhook authentication
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestWebhookAuthentication:
     """
     Webhook auth is provider-agnostic: the endpoint accepts the shared secret
     in either X-Webhook-Secret (new) or X-Postmark-Secret (legacy).
     """
 
-    def test_rejects_request_with_no_secret_header(self, client):
-        response = client.post(
+    async def test_rejects_request_with_no_secret_header(self, async_client):
+        response = await async_client.post(
             "/api/email-intake/inbound",
             json=_make_resend_payload(),
         )
         assert response.status_code == 401
 
-    def test_rejects_request_with_wrong_secret(self, client):
-        response = client.post(
+    async def test_rejects_request_with_wrong_secret(self, async_client):
+        response = await async_client.post(
             "/api/email-intake/inbound",
             json=_make_resend_payload(),
             headers={"X-Webhook-Secret": "wrong-secret"},
         )
         assert response.status_code == 401
 
-    def test_accepts_x_webhook_secret_header(self, client):
+    async def test_accepts_x_webhook_secret_header(self, async_client):
         """New provider-agnostic header is accepted."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         contract = _make_db_contract(user_id=user_id)
@@ -279,7 +264,7 @@ class TestWebhookAuthentication:
                 user_id, [contract], report
             )
 
-            response = client.post(
+            response = await async_client.post(
                 "/api/email-intake/inbound",
                 json=_make_resend_payload(),
                 headers={"X-Webhook-Secret": "test-webhook-secret"},
@@ -287,7 +272,7 @@ class TestWebhookAuthentication:
 
         assert response.status_code == 200
 
-    def test_accepts_legacy_x_postmark_secret_header(self, client):
+    async def test_accepts_legacy_x_postmark_secret_header(self, async_client):
         """Legacy Postmark header still works for backward compatibility."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         contract = _make_db_contract(user_id=user_id)
@@ -301,7 +286,7 @@ class TestWebhookAuthentication:
                 user_id, [contract], report
             )
 
-            response = client.post(
+            response = await async_client.post(
                 "/api/email-intake/inbound",
                 json=_make_postmark_payload(),
                 headers={"X-Postmark-Secret": "test-webhook-secret"},
@@ -314,17 +299,18 @@ class TestWebhookAuthentication:
 # POST /api/email-intake/inbound  — Resend payload (default provider)
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestInboundWebhookResend:
     """POST /api/email-intake/inbound with Resend payload (EMAIL_PROVIDER=resend)."""
 
-    def _post_inbound(self, client, payload: dict, secret: str = "test-webhook-secret"):
-        return client.post(
+    async def _post_inbound(self, async_client, payload: dict, secret: str = "test-webhook-secret"):
+        return await async_client.post(
             "/api/email-intake/inbound",
             json=payload,
             headers={"X-Webhook-Secret": secret},
         )
 
-    def test_high_confidence_match_creates_report(self, client):
+    async def test_high_confidence_match_creates_report(self, async_client):
         """One matching active contract → match_confidence = 'high'."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         contract = _make_db_contract(user_id=user_id)
@@ -338,8 +324,8 @@ class TestInboundWebhookResend:
                 user_id, [contract], report
             )
 
-            response = self._post_inbound(
-                client,
+            response = await self._post_inbound(
+                async_client,
                 _make_resend_payload(
                     from_email="licensee@example.com",
                     to_address="reports-abcd1234@inbound.likha.app",
@@ -352,7 +338,7 @@ class TestInboundWebhookResend:
         assert data["contract_id"] == contract["id"]
         assert data["status"] == "pending"
 
-    def test_no_match_creates_report_with_none_confidence(self, client):
+    async def test_no_match_creates_report_with_none_confidence(self, async_client):
         """No matching contract → match_confidence = 'none', contract_id = null."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_db_inbound_report(
@@ -367,8 +353,8 @@ class TestInboundWebhookResend:
                 user_id, [], report
             )
 
-            response = self._post_inbound(
-                client,
+            response = await self._post_inbound(
+                async_client,
                 _make_resend_payload(
                     from_email="unknown@example.com",
                     to_address="reports-abcd1234@inbound.likha.app",
@@ -380,7 +366,7 @@ class TestInboundWebhookResend:
         assert data["match_confidence"] == "none"
         assert data["contract_id"] is None
 
-    def test_unknown_user_short_id_still_returns_200(self, client):
+    async def test_unknown_user_short_id_still_returns_200(self, async_client):
         """Unknown short_id → 200 (provider must not retry). Report not created."""
         with patch("app.routers.email_intake.supabase_admin") as mock_sb, \
              patch.dict(os.environ, {"EMAIL_PROVIDER": "resend"}):
@@ -390,14 +376,14 @@ class TestInboundWebhookResend:
             users_mock.select.return_value = users_mock
             mock_sb.table.return_value = users_mock
 
-            response = self._post_inbound(
-                client,
+            response = await self._post_inbound(
+                async_client,
                 _make_resend_payload(to_address="reports-xxxxxxxx@inbound.likha.app"),
             )
 
         assert response.status_code == 200
 
-    def test_no_attachment_still_returns_200(self, client):
+    async def test_no_attachment_still_returns_200(self, async_client):
         """No attachment — inbound_report created with no file paths."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_db_inbound_report(
@@ -412,13 +398,13 @@ class TestInboundWebhookResend:
                 user_id, [], report
             )
 
-            response = self._post_inbound(
-                client, _make_resend_payload(attachments=[])
+            response = await self._post_inbound(
+                async_client, _make_resend_payload(attachments=[])
             )
 
         assert response.status_code == 200
 
-    def test_multiple_matches_treated_as_none_confidence(self, client):
+    async def test_multiple_matches_treated_as_none_confidence(self, async_client):
         """Multiple matching contracts → match_confidence = 'none' (MVP cut)."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         contract1 = _make_db_contract(contract_id="c1", user_id=user_id)
@@ -435,8 +421,8 @@ class TestInboundWebhookResend:
                 user_id, [contract1, contract2], report
             )
 
-            response = self._post_inbound(
-                client,
+            response = await self._post_inbound(
+                async_client,
                 _make_resend_payload(
                     from_email="licensee@example.com",
                     to_address="reports-abcd1234@inbound.likha.app",
@@ -452,17 +438,18 @@ class TestInboundWebhookResend:
 # POST /api/email-intake/inbound  — Postmark payload (EMAIL_PROVIDER=postmark)
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestInboundWebhookPostmark:
     """POST /api/email-intake/inbound with Postmark payload (EMAIL_PROVIDER=postmark)."""
 
-    def _post_inbound(self, client, payload: dict, secret: str = "test-webhook-secret"):
-        return client.post(
+    async def _post_inbound(self, async_client, payload: dict, secret: str = "test-webhook-secret"):
+        return await async_client.post(
             "/api/email-intake/inbound",
             json=payload,
             headers={"X-Postmark-Secret": secret},
         )
 
-    def test_high_confidence_match_creates_report(self, client):
+    async def test_high_confidence_match_creates_report(self, async_client):
         """Postmark payload normalizes correctly and creates a matched report."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         contract = _make_db_contract(user_id=user_id)
@@ -476,8 +463,8 @@ class TestInboundWebhookPostmark:
                 user_id, [contract], report
             )
 
-            response = self._post_inbound(
-                client,
+            response = await self._post_inbound(
+                async_client,
                 _make_postmark_payload(
                     from_email="licensee@example.com",
                     to_address="reports-abcd1234@inbound.likha.app",
@@ -490,19 +477,19 @@ class TestInboundWebhookPostmark:
         assert data["contract_id"] == contract["id"]
         assert data["status"] == "pending"
 
-    def test_rejects_missing_secret(self, client):
-        response = client.post(
+    async def test_rejects_missing_secret(self, async_client):
+        response = await async_client.post(
             "/api/email-intake/inbound", json=_make_postmark_payload()
         )
         assert response.status_code == 401
 
-    def test_rejects_wrong_secret(self, client):
-        response = self._post_inbound(
-            client, _make_postmark_payload(), secret="wrong-secret"
+    async def test_rejects_wrong_secret(self, async_client):
+        response = await self._post_inbound(
+            async_client, _make_postmark_payload(), secret="wrong-secret"
         )
         assert response.status_code == 401
 
-    def test_no_attachment_still_returns_200(self, client):
+    async def test_no_attachment_still_returns_200(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_db_inbound_report(
             user_id=user_id, contract_id=None, match_confidence="none"
@@ -516,13 +503,13 @@ class TestInboundWebhookPostmark:
                 user_id, [], report
             )
 
-            response = self._post_inbound(
-                client, _make_postmark_payload(attachments=[])
+            response = await self._post_inbound(
+                async_client, _make_postmark_payload(attachments=[])
             )
 
         assert response.status_code == 200
 
-    def test_unknown_user_short_id_still_returns_200(self, client):
+    async def test_unknown_user_short_id_still_returns_200(self, async_client):
         with patch("app.routers.email_intake.supabase_admin") as mock_sb, \
              patch.dict(os.environ, {"EMAIL_PROVIDER": "postmark"}):
             users_mock = MagicMock()
@@ -531,8 +518,8 @@ class TestInboundWebhookPostmark:
             users_mock.select.return_value = users_mock
             mock_sb.table.return_value = users_mock
 
-            response = self._post_inbound(
-                client,
+            response = await self._post_inbound(
+                async_client,
                 _make_postmark_payload(to_address="reports-xxxxxxxx@inbound.likha.app"),
             )
 
@@ -543,10 +530,11 @@ class TestInboundWebhookPostmark:
 # GET /api/email-intake/reports
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestListReports:
     """GET /api/email-intake/reports returns all inbound_reports for the user."""
 
-    def test_returns_list_of_reports(self, client):
+    async def test_returns_list_of_reports(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_db_inbound_report(user_id=user_id)
         contract = _make_db_contract(user_id=user_id)
@@ -567,16 +555,12 @@ class TestListReports:
             contracts_mock.in_.return_value = contracts_mock
             contracts_mock.select.return_value = contracts_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    return reports_mock
-                if name == "contracts":
-                    return contracts_mock
-                return MagicMock()
+            mock_sb.table.side_effect = {
+                "inbound_reports": reports_mock,
+                "contracts": contracts_mock,
+            }.get
 
-            mock_sb.table.side_effect = table_side_effect
-
-            response = client.get(
+            response = await async_client.get(
                 "/api/email-intake/reports",
                 headers={"Authorization": "Bearer test-token"},
             )
@@ -587,11 +571,11 @@ class TestListReports:
         assert len(data) == 1
         assert data[0]["id"] == report["id"]
 
-    def test_requires_auth(self, client):
-        response = client.get("/api/email-intake/reports")
+    async def test_requires_auth(self, async_client):
+        response = await async_client.get("/api/email-intake/reports")
         assert response.status_code == 401
 
-    def test_returns_empty_list_when_no_reports(self, client):
+    async def test_returns_empty_list_when_no_reports(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
 
         with patch("app.routers.email_intake.supabase_admin") as mock_sb, \
@@ -606,7 +590,7 @@ class TestListReports:
             reports_mock.select.return_value = reports_mock
             mock_sb.table.return_value = reports_mock
 
-            response = client.get(
+            response = await async_client.get(
                 "/api/email-intake/reports",
                 headers={"Authorization": "Bearer test-token"},
             )
@@ -619,10 +603,11 @@ class TestListReports:
 # POST /api/email-intake/{report_id}/confirm
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestConfirmReport:
     """POST /api/email-intake/{report_id}/confirm — user confirms an inbound report."""
 
-    def test_confirm_updates_status_to_confirmed(self, client):
+    async def test_confirm_updates_status_to_confirmed(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_db_inbound_report(user_id=user_id, status="pending")
         confirmed_report = {**report, "status": "confirmed"}
@@ -641,17 +626,12 @@ class TestConfirmReport:
             update_mock.execute.return_value = Mock(data=[confirmed_report])
             update_mock.eq.return_value = update_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    t = MagicMock()
-                    t.select.return_value = fetch_mock
-                    t.update.return_value = update_mock
-                    return t
-                return MagicMock()
-
-            mock_sb.table.side_effect = table_side_effect
+            reports_table = Mock()
+            reports_table.select.return_value = fetch_mock
+            reports_table.update.return_value = update_mock
+            mock_sb.table.side_effect = {"inbound_reports": reports_table}.get
 
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={},
                 headers={"Authorization": "Bearer test-token"},
@@ -661,7 +641,7 @@ class TestConfirmReport:
         data = response.json()
         assert data["status"] == "confirmed"
 
-    def test_confirm_with_manual_contract_id(self, client):
+    async def test_confirm_with_manual_contract_id(self, async_client):
         """User can supply a contract_id to manually assign unmatched report."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_db_inbound_report(
@@ -687,17 +667,21 @@ class TestConfirmReport:
             update_mock.execute.return_value = Mock(data=[confirmed_report])
             update_mock.eq.return_value = update_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    t = MagicMock()
-                    t.select.return_value = fetch_mock
-                    t.update.return_value = update_mock
-                    return t
-                return MagicMock()
-
-            mock_sb.table.side_effect = table_side_effect
-
-            response = client.post(
+            # Ownership check for the supplied contract_id finds the contract
+            owned_contract_mock = Mock()
+            owned_contract_mock.execute.return_value = Mock(data=[{"id": "contract-abc"}])
+            owned_contract_mock.eq.return_value = owned_contract_mock
+            owned_contract_mock.select.return_value = owned_contract_mock
+
+            reports_table = Mock()
+            reports_table.select.return_value = fetch_mock
+            reports_table.update.return_value = update_mock
+            mock_sb.table.side_effect = {
+                "inbound_reports": reports_table,
+                "contracts": owned_contract_mock,
+            }.get
+
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={"contract_id": "contract-abc"},
                 headers={"Authorization": "Bearer test-token"},
@@ -708,7 +692,7 @@ class TestConfirmReport:
         assert data["status"] == "confirmed"
         assert data["contract_id"] == "contract-abc"
 
-    def test_confirm_returns_404_for_unknown_report(self, client):
+    async def test_confirm_returns_404_for_unknown_report(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
 
         with patch("app.routers.email_intake.supabase_admin") as mock_sb, \
@@ -722,7 +706,7 @@ class TestConfirmReport:
             fetch_mock.select.return_value = fetch_mock
             mock_sb.table.return_value = fetch_mock
 
-            response = client.post(
+            response = await async_client.post(
                 "/api/email-intake/nonexistent-id/confirm",
                 json={},
                 headers={"Authorization": "Bearer test-token"},
@@ -730,8 +714,8 @@ class TestConfirmReport:
 
         assert response.status_code == 404
 
-    def test_confirm_requires_auth(self, client):
-        response = client.post("/api/email-intake/report-123/confirm", json={})
+    async def test_confirm_requires_auth(self, async_client):
+        response = await async_client.post("/api/email-intake/report-123/confirm", json={})
         assert response.status_code == 401
 
 
@@ -739,10 +723,11 @@ class TestConfirmReport:
 # POST /api/email-intake/{report_id}/reject
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestRejectReport:
     """POST /api/email-intake/{report_id}/reject — user rejects an inbound report."""
 
-    def test_reject_updates_status_to_rejected(self, client):
+    async def test_reject_updates_status_to_rejected(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_db_inbound_report(user_id=user_id, status="pending")
         rejected_report = {**report, "status": "rejected"}
@@ -761,17 +746,12 @@ class TestRejectReport:
             update_mock.execute.return_value = Mock(data=[rejected_report])
             update_mock.eq.return_value = update_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    t = MagicMock()
-                    t.select.return_value = fetch_mock
-                    t.update.return_value = update_mock
-                    return t
-                return MagicMock()
-
-            mock_sb.table.side_effect = table_side_effect
+            reports_table = Mock()
+            reports_table.select.return_value = fetch_mock
+            reports_table.update.return_value = update_mock
+            mock_sb.table.side_effect = {"inbound_reports": reports_table}.get
 
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/reject",
                 headers={"Authorization": "Bearer test-token"},
             )
@@ -780,7 +760,7 @@ class TestRejectReport:
         data = response.json()
         assert data["status"] == "rejected"
 
-    def test_reject_returns_404_for_unknown_report(self, client):
+    async def test_reject_returns_404_for_unknown_report(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
 
         with patch("app.routers.email_intake.supabase_admin") as mock_sb, \
@@ -794,15 +774,15 @@ class TestRejectReport:
             fetch_mock.select.return_value = fetch_mock
             mock_sb.table.return_value = fetch_mock
 
-            response = client.post(
+            response = await async_client.post(
                 "/api/email-intake/nonexistent-id/reject",
                 headers={"Authorization": "Bearer test-token"},
             )
 
         assert response.status_code == 404
 
-    def test_reject_requires_auth(self, client):
-        response = client.post("/api/email-intake/report-123/reject")
+    async def test_reject_requires_auth(self, async_client):
+        response = await async_client.post("/api/email-intake/report-123/reject")
         assert response.status_code == 401
 
 
@@ -1674,21 +1654,18 @@ def _make_confirm_table_side_effect(report_before: dict, report_after: dict):
     update_mock.execute.return_value = Mock(data=[report_after])
     update_mock.eq.return_value = update_mock
 
-    def side_effect(name):
-        if name == "inbound_reports":
-            t = MagicMock()
-            t.select.return_value = fetch_mock
-            t.update.return_value = update_mock
-            return t
-        return MagicMock()
+    reports_table = Mock()
+    reports_table.select.return_value = fetch_mock
+    reports_table.update.return_value = update_mock
 
-    return side_effect
+    return {"inbound_reports": reports_table}.get
 
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestConfirmReportWithOpenWizard:
     """POST /api/email-intake/{report_id}/confirm — open_wizard support."""
 
-    def test_open_wizard_false_returns_no_redirect_url(self, client):
+    async def test_open_wizard_false_returns_no_redirect_url(self, async_client):
         """open_wizard=false (default) → no redirect_url in response."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_inbound_report_with_new_fields(user_id=user_id)
@@ -1700,7 +1677,7 @@ class TestConfirmReportWithOpenWizard:
             mock_auth_sb.auth.get_user.return_value = Mock(user=Mock(id=user_id))
             mock_sb.table.side_effect = _make_confirm_table_side_effect(report, confirmed)
 
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={"open_wizard": False},
                 headers={"Authorization": "Bearer test-token"},
@@ -1710,7 +1687,7 @@ class TestConfirmReportWithOpenWizard:
         data = response.json()
         assert data.get("redirect_url") is None
 
-    def test_open_wizard_true_returns_redirect_url(self, client):
+    async def test_open_wizard_true_returns_redirect_url(self, async_client):
         """open_wizard=true → redirect_url with contract_id, report_id and source."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_inbound_report_with_new_fields(
@@ -1725,7 +1702,7 @@ class TestConfirmReportWithOpenWizard:
             mock_auth_sb.auth.get_user.return_value = Mock(user=Mock(id=user_id))
             mock_sb.table.side_effect = _make_confirm_table_side_effect(report, confirmed)
 
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={"open_wizard": True},
                 headers={"Authorization": "Bearer test-token"},
@@ -1740,7 +1717,7 @@ class TestConfirmReportWithOpenWizard:
         assert f"report_id={report['id']}" in url
         assert "source=inbox" in url
 
-    def test_open_wizard_true_with_period_dates_includes_period_params(self, client):
+    async def test_open_wizard_true_with_period_dates_includes_period_params(self, async_client):
         """open_wizard=true + period dates → redirect_url includes period_start/end."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_inbound_report_with_new_fields(
@@ -1757,7 +1734,7 @@ class TestConfirmReportWithOpenWizard:
             mock_auth_sb.auth.get_user.return_value = Mock(user=Mock(id=user_id))
             mock_sb.table.side_effect = _make_confirm_table_side_effect(report, confirmed)
 
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={"open_wizard": True},
                 headers={"Authorization": "Bearer test-token"},
@@ -1768,7 +1745,7 @@ class TestConfirmReportWithOpenWizard:
         assert "period_start=2025-01-01" in url
         assert "period_end=2025-03-31" in url
 
-    def test_open_wizard_true_without_period_dates_omits_period_params(self, client):
+    async def test_open_wizard_true_without_period_dates_omits_period_params(self, async_client):
         """open_wizard=true + no period dates → redirect_url has NO period params."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_inbound_report_with_new_fields(
@@ -1785,7 +1762,7 @@ class TestConfirmReportWithOpenWizard:
             mock_auth_sb.auth.get_user.return_value = Mock(user=Mock(id=user_id))
             mock_sb.table.side_effect = _make_confirm_table_side_effect(report, confirmed)
 
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={"open_wizard": True},
                 headers={"Authorization": "Bearer test-token"},
@@ -1796,7 +1773,7 @@ class TestConfirmReportWithOpenWizard:
         assert "period_start" not in url
         assert "period_end" not in url
 
-    def test_open_wizard_true_without_attachment_returns_422(self, client):
+    async def test_open_wizard_true_without_attachment_returns_422(self, async_client):
         """open_wizard=true on a report with no attachment → 422."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_inbound_report_with_new_fields(
@@ -1815,16 +1792,11 @@ class TestConfirmReportWithOpenWizard:
             fetch_mock.eq.return_value = fetch_mock
             fetch_mock.select.return_value = fetch_mock
 
-            def side_effect(name):
-                if name == "inbound_reports":
-                    t = MagicMock()
-                    t.select.return_value = fetch_mock
-                    return t
-                return MagicMock()
+            reports_table = Mock()
+            reports_table.select.return_value = fetch_mock
+            mock_sb.table.side_effect = {"inbound_reports": reports_table}.get
 
-            mock_sb.table.side_effect = side_effect
-
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={"open_wizard": True},
                 headers={"Authorization": "Bearer test-token"},
@@ -1832,7 +1804,7 @@ class TestConfirmReportWithOpenWizard:
 
         assert response.status_code == 422
 
-    def test_open_wizard_default_is_false(self, client):
+    async def test_open_wizard_default_is_false(self, async_client):
         """Omitting open_wizard from body is equivalent to open_wizard=false."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = _make_inbound_report_with_new_fields(user_id=user_id)
@@ -1844,7 +1816,7 @@ class TestConfirmReportWithOpenWizard:
             mock_auth_sb.auth.get_user.return_value = Mock(user=Mock(id=user_id))
             mock_sb.table.side_effect = _make_confirm_table_side_effect(report, confirmed)
 
-            response = client.post(
+            response = await async_client.post(
                 f"/api/email-intake/{report['id']}/confirm",
                 json={},
                 headers={"Authorization": "Bearer test-token"},
@@ -1859,10 +1831,11 @@ class TestConfirmReportWithOpenWizard:
 # PATCH /{report_id} — sales_period_id linkback
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestSalesPeriodLinkback:
     """PATCH /api/email-intake/{report_id} — link sales_period_id, status → 'processed'."""
 
-    def test_patch_sales_period_id_updates_report(self, client):
+    async def test_patch_sales_period_id_updates_report(self, async_client):
         """PATCH with sales_period_id → links report to sales period, status='processed'."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         sales_period_id = "sp-uuid-0000-0000-0000-000000000001"
@@ -1889,17 +1862,12 @@ class TestSalesPeriodLinkback:
             update_mock.execute.return_value = Mock(data=[processed_report])
             update_mock.eq.return_value = update_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    t = MagicMock()
-                    t.select.return_value = fetch_mock
-                    t.update.return_value = update_mock
-                    return t
-                return MagicMock()
-
-            mock_sb.table.side_effect = table_side_effect
+            reports_table = Mock()
+            reports_table.select.return_value = fetch_mock
+            reports_table.update.return_value = update_mock
+            mock_sb.table.side_effect = {"inbound_reports": reports_table}.get
 
-            response = client.patch(
+            response = await async_client.patch(
                 f"/api/email-intake/{report['id']}",
                 json={"sales_period_id": sales_period_id},
                 headers={"Authorization": "Bearer test-token"},
@@ -1910,14 +1878,14 @@ class TestSalesPeriodLinkback:
         assert data["sales_period_id"] == sales_period_id
         assert data["status"] == "processed"
 
-    def test_patch_requires_auth(self, client):
-        response = client.patch(
+    async def test_patch_requires_auth(self, async_client):
+        response = await async_client.patch(
             "/api/email-intake/report-123",
             json={"sales_period_id": "sp-123"},
         )
         assert response.status_code == 401
 
-    def test_patch_returns_404_for_unknown_report(self, client):
+    async def test_patch_returns_404_for_unknown_report(self, async_client):
         user_id = "abcd1234-0000-0000-0000-000000000000"
 
         with patch("app.routers.email_intake.supabase_admin") as mock_sb, \
@@ -1931,7 +1899,7 @@ class TestSalesPeriodLinkback:
             fetch_mock.select.return_value = fetch_mock
             mock_sb.table.return_value = fetch_mock
 
-            response = client.patch(
+            response = await async_client.patch(
                 "/api/email-intake/nonexistent-id",
                 json={"sales_period_id": "sp-123"},
                 headers={"Authorization": "Bearer test-token"},
@@ -1939,7 +1907,7 @@ class TestSalesPeriodLinkback:
 
         assert response.status_code == 404
 
-    def test_patch_status_transitions_to_processed(self, client):
+    async def test_patch_status_transitions_to_processed(self, async_client):
         """Verify status field is explicitly set to 'processed' by the endpoint."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         sales_period_id = "sp-uuid-0000-0000-0000-000000000002"
@@ -1966,17 +1934,12 @@ class TestSalesPeriodLinkback:
             update_mock.execute.return_value = Mock(data=[processed_report])
             update_mock.eq.return_value = update_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    t = MagicMock()
-                    t.select.return_value = fetch_mock
-                    t.update.return_value = update_mock
-                    return t
-                return MagicMock()
+            reports_table = Mock()
+            reports_table.select.return_value = fetch_mock
+            reports_table.update.return_value = update_mock
+            mock_sb.table.side_effect = {"inbound_reports": reports_table}.get
 
-            mock_sb.table.side_effect = table_side_effect
-
-            response = client.patch(
+            response = await async_client.patch(
                 f"/api/email-intake/{report['id']}",
                 json={"sales_period_id": sales_period_id},
                 headers={"Authorization": "Bearer test-token"},
@@ -2335,6 +2298,7 @@ class TestExtractAttachmentPreview:
 # GET /api/email-intake/reports — attachment preview fields in response
 # ===========================================================================
 
+@pytest.mark.asyncio(loop_scope="session")
 class TestInboundReportPreviewFieldsInResponse:
     """
     Verify that attachment_metadata_rows and attachment_sample_rows are
@@ -2358,7 +2322,7 @@ class TestInboundReportPreviewFieldsInResponse:
         base["attachment_sample_rows"] = sample_rows
         return base
 
-    def test_list_reports_includes_attachment_metadata_rows_when_present(self, client):
+    async def test_list_reports_includes_attachment_metadata_rows_when_present(self, async_client):
         """attachment_metadata_rows is returned when populated."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         metadata = [
@@ -2386,16 +2350,12 @@ class TestInboundReportPreviewFieldsInResponse:
             contracts_mock.in_.return_value = contracts_mock
             contracts_mock.select.return_value = contracts_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    return reports_mock
-                if name == "contracts":
-                    return contracts_mock
-                return MagicMock()
-
-            mock_sb.table.side_effect = table_side_effect
+            mock_sb.table.side_effect = {
+                "inbound_reports": reports_mock,
+                "contracts": contracts_mock,
+            }.get
 
-            response = client.get(
+            response = await async_client.get(
                 "/api/email-intake/reports",
                 headers={"Authorization": "Bearer test-token"},
             )
@@ -2405,7 +2365,7 @@ class TestInboundReportPreviewFieldsInResponse:
         assert len(data) == 1
         assert data[0]["attachment_metadata_rows"] == metadata
 
-    def test_list_reports_includes_attachment_sample_rows_when_present(self, client):
+    async def test_list_reports_includes_attachment_sample_rows_when_present(self, async_client):
         """attachment_sample_rows is returned when populated."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         sample = {
@@ -2433,16 +2393,12 @@ class TestInboundReportPreviewFieldsInResponse:
             contracts_mock.in_.return_value = contracts_mock
             contracts_mock.select.return_value = contracts_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    return reports_mock
-                if name == "contracts":
-                    return contracts_mock
-                return MagicMock()
+            mock_sb.table.side_effect = {
+                "inbound_reports": reports_mock,
+                "contracts": contracts_mock,
+            }.get
 
-            mock_sb.table.side_effect = table_side_effect
-
-            response = client.get(
+            response = await async_client.get(
                 "/api/email-intake/reports",
                 headers={"Authorization": "Bearer test-token"},
             )
@@ -2452,7 +2408,7 @@ class TestInboundReportPreviewFieldsInResponse:
         assert len(data) == 1
         assert data[0]["attachment_sample_rows"] == sample
 
-    def test_list_reports_preview_fields_are_null_when_absent(self, client):
+    async def test_list_reports_preview_fields_are_null_when_absent(self, async_client):
         """attachment_metadata_rows and attachment_sample_rows default to null."""
         user_id = "abcd1234-0000-0000-0000-000000000000"
         report = self._make_report_with_preview(user_id=user_id)  # both None
@@ -2474,16 +2430,12 @@ class TestInboundReportPreviewFieldsInResponse:
             contracts_mock.in_.return_value = contracts_mock
             contracts_mock.select.return_value = contracts_mock
 
-            def table_side_effect(name):
-                if name == "inbound_reports":
-                    return reports_mock
-                if name == "contracts":
-                    return contracts_mock
-                return MagicMock()
-
-            mock_sb.table.side_effect = table_side_effect
+            mock_sb.table.side_effect = {
+                "inbound_reports": reports_mock,
+                "contracts": contracts_mock,
+            }.get
 
-            response = client.get(
+            response = await async_client.get(
                 "/api/email-intake/reports",
                 headers={"Authorization": "Bearer test-token"},
             )
@@ -1,7 +1,8 @@
 """
 Integration tests for end-to-end API flows.
 
-Tests full request/response cycles through the FastAPI app using TestClient.
+Tests full request/response cycles through the FastAPI app in-process
+(the shared async_client from conftest.py).
 All external dependencies (Supabase, Anthropic) are mocked — no real DB or
 AI API calls are made.
 
@@ -14,63 +15,82 @@ Flows tested:
 """
 
 import io
+import json
 import os
+import httpx
 import pytest
+from datetime import datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from typing import Optional
+from unittest.mock import DEFAULT, Mock, patch
+
+from fastapi import Header, HTTPException, UploadFile
+from starlette.datastructures import Headers
 
 # Ensure env vars are set before any app import
 os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
 os.environ.setdefault("SUPABASE_KEY", "test-anon-key")
 os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
 
-from fastapi.testclient import TestClient
+from app.auth import get_current_user
+from app.main import app
+from app.routers.contracts import extract_contract_terms
+
+# Every test drives the app through the session-scoped async_client, so all
+# of them run on the one session event loop.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 # ---------------------------------------------------------------------------
 # Shared DB row factories
 # ---------------------------------------------------------------------------
 
-def _make_db_contract(
-    contract_id: str = "contract-abc",
-    user_id: str = "user-abc",
-    status: str = "active",
-    licensee_name: str = "Acme Licensing Co.",
-    royalty_rate: str = "8%",
-    minimum_guarantee: str = "0",
-    minimum_guarantee_period: str = "annually",
-    advance_payment: str | None = None,
-    contract_start_date: str = "2026-01-01",
-    contract_end_date: str = "2026-12-31",
-    reporting_frequency: str = "quarterly",
-    filename: str = "acme_license.pdf",
-    licensee_email: str | None = "acme@example.com",
-) -> dict:
+# Module-level rows, payloads and headers are shared by every test in the
+# module, so they are frozen (MappingProxyType, tuples): a test or route that
+# tries to mutate one fails at the offending line instead of leaking into
+# whichever test runs next.
+
+# Defaults for a full Supabase contracts row. Fields derived from user_id,
+# filename or licensee_name are filled in by _make_db_contract.
+_BASE_CONTRACT = MappingProxyType({
+    "id": "contract-abc",
+    "user_id": "user-abc",
+    "status": "active",
+    "filename": "acme_license.pdf",
+    "licensee_name": "Acme Licensing Co.",
+    "licensee_email": "acme@example.com",
+    "agreement_number": "LKH-2026-1",
+    "royalty_rate": "8%",
+    "royalty_base": "net sales",
+    "product_categories": None,
+    "contract_start_date": "2026-01-01",
+    "contract_end_date": "2026-12-31",
+    "minimum_guarantee": "0",
+    "minimum_guarantee_period": "annually",
+    "advance_payment": None,
+    "reporting_frequency": "quarterly",
+    "created_at": "2026-01-15T10:00:00Z",
+    "updated_at": "2026-01-15T10:00:00Z",
+})
+
+
+def _make_db_contract(contract_id: str = "contract-abc", **overrides) -> dict:
     """Return a minimal dict that mimics a full Supabase contracts row."""
-    return {
-        "id": contract_id,
-        "user_id": user_id,
-        "status": status,
-        "filename": filename,
-        "licensee_name": licensee_name,
-        "licensee_email": licensee_email,
-        "agreement_number": f"LKH-2026-1",
+    row = {**_BASE_CONTRACT, "id": contract_id, **overrides}
+    user_id, filename = row["user_id"], row["filename"]
+    derived = {
         "pdf_url": f"https://test.supabase.co/storage/v1/object/sign/contracts/{user_id}/{filename}?token=abc",
         "storage_path": f"contracts/{user_id}/{filename}",
-        "extracted_terms": {"licensee_name": licensee_name},
-        "royalty_rate": royalty_rate,
-        "royalty_base": "net sales",
+        "extracted_terms": {"licensee_name": row["licensee_name"]},
         "territories": ["Worldwide"],
-        "product_categories": None,
-        "contract_start_date": contract_start_date,
-        "contract_end_date": contract_end_date,
-        "minimum_guarantee": minimum_guarantee,
-        "minimum_guarantee_period": minimum_guarantee_period,
-        "advance_payment": advance_payment,
-        "reporting_frequency": reporting_frequency,
-        "created_at": "2026-01-15T10:00:00Z",
-        "updated_at": "2026-01-15T10:00:00Z",
     }
+    row.update((key, value) for key, value in derived.items() if key not in overrides)
+    return row
+
+
+# "contract-abc" owned by "user-abc": active, 8% of net sales, no minimum.
+_DEFAULT_CONTRACT = MappingProxyType(_make_db_contract())
 
 
 def _make_db_draft_contract(**overrides) -> dict:
@@ -121,31 +141,347 @@ def _make_db_sales_period(
     }
 
 
+def _async_return(value):
+    """Coroutine function that returns value; a cheap AsyncMock(return_value=...)."""
+    async def _returns(*args, **kwargs):
+        return value
+    return _returns
+
+
+def _async_raise(exc):
+    """Coroutine function that raises exc; a cheap AsyncMock(side_effect=...)."""
+    async def _raises(*args, **kwargs):
+        raise exc
+    return _raises
+
+
+class _SupaChain:
+    """
+    Stand-in for a Supabase query builder whose chain ends in a fixed result.
+
+    Every builder method (table, select, eq, insert, order, ...) returns self
+    and execute() returns self, so `.table(...).select(...).eq(...).execute().data`
+    yields `data` without allocating a child Mock per attribute.
+    """
+
+    def __init__(self, data=None):
+        self.data = [] if data is None else data
+
+    def __getattr__(self, name):
+        return self._chain
+
+    def _chain(self, *args, **kwargs):
+        return self
+
+    def execute(self):
+        return self
+
+
+_EMPTY_CHAIN = _SupaChain(())
+
+
+class _SupaOps:
+    """
+    Stand-in for a table whose chains end in rows chosen per operation.
+
+    set_rows(select=[...], update=[...]) makes `.select(...)...execute().data`
+    and `.update(...)...execute().data` return those rows; operations left
+    unset return the empty chain.
+    """
+
+    def __init__(self):
+        self._chains = {}
+
+    def set_rows(self, **rows_by_op):
+        self._chains = {op: _SupaChain(rows) for op, rows in rows_by_op.items()}
+
+    def __getattr__(self, op):
+        chain = self._chains.get(op, _EMPTY_CHAIN)
+        return lambda *args, **kwargs: chain
+
+
+class _SupaTables:
+    """
+    Supabase client stand-in: table(name) chains end in the rows set for name.
+
+    One chain per table is built by set_rows and returned on every table()
+    call; unknown tables share the empty _EMPTY_CHAIN.
+    """
+
+    def __init__(self):
+        self._chains = {}
+
+    def set_rows(self, **rows_by_table):
+        self._chains = {name: _SupaChain(rows) for name, rows in rows_by_table.items()}
+
+    def table(self, name):
+        return self._chains.get(name, _EMPTY_CHAIN)
+
+
+# Expected money amounts. Pydantic serialises Decimal fields as strings,
+# so responses are parsed with _as_decimal(value) and compared to these.
+_ZERO = Decimal("0")
+_ROYALTY_8PCT_OF_100K = Decimal("8000")
+_YTD_SALES_TWO_PERIODS = Decimal("250000")
+_YTD_ROYALTIES_TWO_PERIODS = Decimal("20000")
+_MG_YTD = Decimal("25000")
+_MG_SHORTFALL = Decimal("17000")
+_UNDER_REPORTED_BY = Decimal("500")
+_OVER_REPORTED_BY = Decimal("-1000")
+
+
+def _as_decimal(value):
+    """Parse a serialised Decimal field; None (a null amount) passes through."""
+    return None if value is None else Decimal(value)
+
+
+_FAKE_PDF_BYTES = b"%PDF-1.4 fake content"
+
+# extract_contract / normalize_extracted_terms results are only read through
+# model_dump(), so plain namespaces over shared dicts stand in for the models.
+_EXTRACTED_TERMS = SimpleNamespace(model_dump=lambda: {
+    "licensee_name": "Acme Licensing Co.",
+    "royalty_rate": "8%",
+    "royalty_base": "net sales",
+    "territories": ["Worldwide"],
+    "contract_start_date": "2026-01-01",
+    "contract_end_date": "2026-12-31",
+    "minimum_guarantee": "10000",
+    "advance_payment": None,
+    "reporting_frequency": "quarterly",
+})
+_TOKEN_USAGE = MappingProxyType({"input_tokens": 200, "output_tokens": 150, "total_tokens": 350})
+_FORM_VALUES = SimpleNamespace(model_dump=lambda: {"licensee_name": "Acme Licensing Co."})
+
+
+def _pdf_upload_file(filename: str = "license.pdf") -> UploadFile:
+    """UploadFile over the fake PDF, for calling the /extract route directly."""
+    return UploadFile(
+        io.BytesIO(_FAKE_PDF_BYTES),
+        filename=filename,
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+
+def _encode_multipart(files: dict) -> tuple[bytes, str]:
+    """Encode files= once the way httpx would; return (body, content-type)."""
+    request = httpx.Request("POST", "http://testserver", files=files)
+    return request.read(), request.headers["content-type"]
+
+
+# /extract upload of license.pdf, encoded once and sent as raw content.
+_LICENSE_PDF_BODY, _LICENSE_PDF_CONTENT_TYPE = _encode_multipart(
+    {"file": ("license.pdf", _FAKE_PDF_BYTES, "application/pdf")}
+)
+
+# /extract upload of a spreadsheet, which must be rejected as non-PDF.
+_REPORT_XLSX_BODY, _REPORT_XLSX_CONTENT_TYPE = _encode_multipart(
+    {"file": (
+        "report.xlsx",
+        b"",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )}
+)
+
+
+@pytest.fixture
+def contracts_db():
+    """Patch app.routers.contracts.supabase_admin; every table is one _SupaOps."""
+    table = _SupaOps()
+    with patch("app.routers.contracts.supabase_admin", SimpleNamespace(table=lambda name: table)):
+        yield table
+
+
+@pytest.fixture
+def sales_db():
+    """
+    Patch app.routers.sales.supabase with a _SupaTables and let every
+    ownership check pass; tests fill tables with sales_db.set_rows(...).
+    """
+    db = _SupaTables()
+    with patch("app.routers.sales.supabase", db), \
+         patch("app.routers.sales.verify_contract_ownership", new=_OWNERSHIP_OK):
+        yield db
+
+
+class _ContractsDeleteDb:
+    """
+    Pre-wired stand-in for the DELETE /api/contracts/{id} collaborators.
+
+    configure_success(contract) makes the ownership check return contract and
+    the DELETE query return it as the deleted row; configure_404() makes the
+    ownership check raise 404. delete_pdf records delete_contract_pdf calls.
+    """
+
+    def __init__(self):
+        self.table = _SupaOps()
+        self.delete_pdf = Mock()
+        self.verify_ownership = _OWNERSHIP_OK
+
+    def configure_success(self, contract):
+        self.verify_ownership = _async_return(contract)
+        self.table.set_rows(delete=[contract])
+
+    def configure_404(self):
+        self.verify_ownership = _async_raise(_NOT_FOUND)
+        self.table.set_rows()
+
+    async def _verify(self, contract_id, user_id):
+        return await self.verify_ownership(contract_id, user_id)
+
+
+@pytest.fixture
+def mock_contracts_db():
+    """Patch supabase_admin, delete_contract_pdf and the ownership check for deletes."""
+    db = _ContractsDeleteDb()
+    with patch("app.routers.contracts.supabase_admin", SimpleNamespace(table=lambda name: db.table)), \
+         patch("app.routers.contracts.delete_contract_pdf", db.delete_pdf), \
+         patch("app.routers.contracts.verify_contract_ownership", new=db._verify):
+        yield db
+
+
 # ---------------------------------------------------------------------------
 # Auth helpers used across tests
 # ---------------------------------------------------------------------------
 
-def _auth_header(user_id: str = "user-abc") -> dict:
-    """Return Authorization header and set up remote auth mock via context."""
-    return {"Authorization": "Bearer valid-test-token"}
+_FORBIDDEN = HTTPException(status_code=403, detail="You are not authorized to access this contract")
+_NOT_FOUND = HTTPException(status_code=404, detail="Contract not found")
+
+# verify_contract_ownership stand-in for tests where ownership always passes.
+_OWNERSHIP_OK = _async_return(None)
+
+# PUT /confirm bodies: a fully populated draft and a bare-minimum one.
+_CONFIRM_PAYLOAD_ACME = MappingProxyType({
+    "licensee_name": "Acme Licensing Co.",
+    "licensee_email": "acme@example.com",
+    "royalty_rate": "8%",
+    "royalty_base": "net_sales",
+    "territories": ("Worldwide",),
+    "product_categories": None,
+    "contract_start_date": "2026-01-01",
+    "contract_end_date": "2026-12-31",
+    "minimum_guarantee": "10000.00",
+    "minimum_guarantee_period": "annually",
+    "advance_payment": None,
+    "reporting_frequency": "quarterly",
+})
+
+_CONFIRM_PAYLOAD_MINIMAL = MappingProxyType({
+    "licensee_name": "Acme",
+    "licensee_email": None,
+    "royalty_rate": "8%",
+    "royalty_base": "net_sales",
+    "territories": (),
+    "product_categories": None,
+    "contract_start_date": "2026-01-01",
+    "contract_end_date": "2026-12-31",
+    "minimum_guarantee": "0",
+    "minimum_guarantee_period": "annually",
+    "advance_payment": None,
+    "reporting_frequency": "quarterly",
+})
+
+# POST /api/sales/ body: contract-abc, Q1 2026, $100,000 net sales.
+_SALES_PAYLOAD = MappingProxyType({
+    "contract_id": "contract-abc",
+    "period_start": "2026-01-01",
+    "period_end": "2026-03-31",
+    "net_sales": "100000",
+})
+
+
+def _sales_body(**overrides) -> bytes:
+    """JSON-encode _SALES_PAYLOAD with overrides, for sending as raw content."""
+    return json.dumps({**_SALES_PAYLOAD, **overrides}).encode()
+
+
+# Confirm bodies are encoded once and sent as raw content.
+_CONFIRM_BODY_ACME = json.dumps(dict(_CONFIRM_PAYLOAD_ACME)).encode()
+_CONFIRM_BODY_MINIMAL = json.dumps(dict(_CONFIRM_PAYLOAD_MINIMAL)).encode()
+
+_AUTH_HEADER = MappingProxyType({"Authorization": "Bearer valid-test-token"})
+_JSON_AUTH_HEADER = MappingProxyType({**_AUTH_HEADER, "Content-Type": "application/json"})
+_OTHER_AUTH_HEADER = MappingProxyType({"Authorization": "Bearer other-test-token"})
+
+# Users the current_user override resolves each Authorization header to.
+_HEADER_USERS = MappingProxyType({
+    _AUTH_HEADER["Authorization"]: "user-abc",
+    _OTHER_AUTH_HEADER["Authorization"]: "user-other",
+})
+
+
+# app.auth.supabase is replaced with this mock once for the whole module
+# (see _patch_supabase_auth); TestAuthFlow reconfigures auth.get_user to
+# exercise the real get_current_user.
+_AUTH_SUPABASE = Mock()
+
+
+async def _current_user_override(authorization: Optional[str] = Header(None)) -> str:
+    """Stand-in for get_current_user that looks the header up in _HEADER_USERS."""
+    if authorization not in _HEADER_USERS:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return _HEADER_USERS[authorization]
+
+
+async def _assert_error_status(
+    async_client, method, url, payload, patch_target, exc, expected_status,
+):
+    """
+    Send one request and assert its status code.
+
+    With no patch_target the request goes out without an Authorization header
+    through the real get_current_user; otherwise patch_target is patched to
+    raise exc and the request is authenticated as "user-other".
+    """
+    if patch_target is None:
+        response = await _unauthenticated_request(async_client, method, url)
+        assert response.status_code == expected_status, response.text
+        return
+    # Shared payloads are frozen mappings; json.dumps needs a plain dict.
+    body = None if payload is None else dict(payload)
+    with patch(patch_target, new=_async_raise(exc)):
+        response = await async_client.request(
+            method, url, json=body, headers=_OTHER_AUTH_HEADER,
+        )
+    assert response.status_code == expected_status, response.text
+
 
+async def _unauthenticated_request(async_client, method, url):
+    """
+    Send one request without an Authorization header and return the response.
 
-def _patch_auth(user_id: str = "user-abc"):
-    """Context manager: patch supabase.auth.get_user to return user_id."""
-    mock_sb = MagicMock()
-    mock_sb.auth.get_user.return_value = Mock(user=Mock(id=user_id))
-    return patch("app.auth.supabase", mock_sb)
+    The current_user override is removed first, so the request is rejected
+    by the real get_current_user rather than the test stand-in.
+    """
+    app.dependency_overrides.pop(get_current_user, None)
+    return await async_client.request(method, url)
 
 
-# ---------------------------------------------------------------------------
-# App fixture
-# ---------------------------------------------------------------------------
+@pytest.fixture(scope="module", autouse=True)
+def _patch_supabase_auth():
+    """Install _AUTH_SUPABASE as app.auth.supabase for every test in this module."""
+    with patch("app.auth.supabase", _AUTH_SUPABASE):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def auth_supabase():
+    """The shared auth mock, reset to resolve tokens to "user-abc"."""
+    _AUTH_SUPABASE.reset_mock(return_value=True, side_effect=True)
+    _AUTH_SUPABASE.auth.get_user.return_value = Mock(user=Mock(id="user-abc"))
+    return _AUTH_SUPABASE
+
 
-@pytest.fixture()
-def client():
-    """Return a TestClient for the full FastAPI app with nothing pre-mocked."""
-    from app.main import app
-    return TestClient(app)
+@pytest.fixture
+def current_user():
+    """
+    Override get_current_user so requests skip token verification.
+
+    Requests resolve to the user _HEADER_USERS maps their Authorization header
+    to; any other header, or none, gets 401. conftest clears the override after
+    each test.
+    """
+    app.dependency_overrides[get_current_user] = _current_user_override
 
 
 # ===========================================================================
@@ -159,83 +495,76 @@ class TestAuthFlow:
     We use GET /api/contracts/ as a representative protected endpoint.
     """
 
-    def test_missing_auth_header_returns_401(self, client):
+    async def test_missing_auth_header_returns_401(self, async_client):
         """Request with no Authorization header should be rejected with 401."""
-        response = client.get("/api/contracts/")
+        response = await async_client.get("/api/contracts/")
         assert response.status_code == 401
         assert response.json()["detail"] == "Not authenticated"
 
-    def test_malformed_auth_header_returns_401(self, client):
+    async def test_malformed_auth_header_returns_401(self, async_client):
         """Token without 'Bearer ' prefix should be rejected."""
-        response = client.get(
+        response = await async_client.get(
             "/api/contracts/",
             headers={"Authorization": "Token some-random-token"},
         )
         assert response.status_code == 401
         assert "Invalid authentication" in response.json()["detail"]
 
-    def test_invalid_token_returns_401(self, client):
+    async def test_invalid_token_returns_401(self, async_client, auth_supabase):
         """An unrecognised token should be rejected with 401."""
-        with patch("app.auth.supabase") as mock_sb:
-            mock_sb.auth.get_user.side_effect = Exception("Invalid JWT")
+        auth_supabase.auth.get_user.side_effect = Exception("Invalid JWT")
 
-            response = client.get(
-                "/api/contracts/",
-                headers={"Authorization": "Bearer bad-token"},
-            )
+        response = await async_client.get(
+            "/api/contracts/",
+            headers={"Authorization": "Bearer bad-token"},
+        )
 
         assert response.status_code == 401
         assert "Invalid token" in response.json()["detail"]
 
-    def test_expired_token_returns_401(self, client):
+    async def test_expired_token_returns_401(self, async_client, auth_supabase):
         """An expired token should return 401 with an 'expired' message."""
-        with patch("app.auth.supabase") as mock_sb:
-            mock_sb.auth.get_user.side_effect = Exception("Token expired")
+        auth_supabase.auth.get_user.side_effect = Exception("Token expired")
 
-            response = client.get(
-                "/api/contracts/",
-                headers={"Authorization": "Bearer expired-token"},
-            )
+        response = await async_client.get(
+            "/api/contracts/",
+            headers={"Authorization": "Bearer expired-token"},
+        )
 
         assert response.status_code == 401
         assert "expired" in response.json()["detail"].lower()
 
-    def test_valid_token_returns_200(self, client):
+    async def test_valid_token_returns_200(self, async_client):
         """A valid token should let the request through (even if no data)."""
-        with _patch_auth("user-abc") as mock_sb:
-            with patch("app.routers.contracts.supabase_admin") as mock_db:
-                mock_db.table.return_value.select.return_value \
-                    .eq.return_value.eq.return_value.execute.return_value = Mock(data=[])
-
-                response = client.get(
-                    "/api/contracts/",
-                    headers=_auth_header(),
-                )
+        with patch("app.routers.contracts.supabase_admin", _SupaChain()):
+            response = await async_client.get(
+                "/api/contracts/",
+                headers=_AUTH_HEADER,
+            )
 
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_token_that_has_no_user_returns_401(self, client):
+    async def test_token_that_has_no_user_returns_401(self, async_client, auth_supabase):
         """Token that resolves to no user object should return 401."""
-        with patch("app.auth.supabase") as mock_sb:
-            mock_sb.auth.get_user.return_value = Mock(user=None)
+        auth_supabase.auth.get_user.return_value = Mock(user=None)
 
-            response = client.get(
-                "/api/contracts/",
-                headers={"Authorization": "Bearer no-user-token"},
-            )
+        response = await async_client.get(
+            "/api/contracts/",
+            headers={"Authorization": "Bearer no-user-token"},
+        )
 
         assert response.status_code == 401
 
-    def test_health_endpoint_requires_no_auth(self, client):
+    async def test_health_endpoint_requires_no_auth(self, async_client):
         """GET /health should be publicly accessible without any token."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
         assert response.json()["status"] == "ok"
 
-    def test_root_endpoint_requires_no_auth(self, client):
+    async def test_root_endpoint_requires_no_auth(self, async_client):
         """GET / should be publicly accessible."""
-        response = client.get("/")
+        response = await async_client.get("/")
         assert response.status_code == 200
 
 
@@ -243,6 +572,7 @@ class TestAuthFlow:
 # 2. Contract upload → extraction → draft → confirm
 # ===========================================================================
 
+@pytest.mark.usefixtures("current_user")
 class TestContractUploadFlow:
     """
     End-to-end flow: POST /extract → GET /{id} (draft) → PUT /{id}/confirm.
@@ -251,49 +581,25 @@ class TestContractUploadFlow:
     Supabase admin client is mocked throughout.
     """
 
-    # -----------------------------------------------------------------------
-    # Helpers
-    # -----------------------------------------------------------------------
-
-    def _make_pdf_upload(self, filename: str = "license.pdf") -> dict:
-        """Build a multipart upload payload for the /extract endpoint."""
-        return {
-            "file": (filename, io.BytesIO(b"%PDF-1.4 fake content"), "application/pdf"),
-        }
-
-    def _mock_no_duplicate(self, mock_db):
-        """Configure supabase mock: duplicate-filename check returns empty."""
-        mock_db.table.return_value.select.return_value \
-            .eq.return_value.ilike.return_value.execute.return_value = Mock(data=[])
-
-    def _mock_draft_insert(self, mock_db, draft_row: dict):
-        """Configure supabase mock: INSERT returns the draft row."""
-        mock_db.table.return_value.insert.return_value.execute.return_value = Mock(
-            data=[draft_row]
-        )
-
-    def _extracted_terms_mock(self):
-        """Return (ExtractedTerms mock, token_usage dict)."""
-        terms = MagicMock()
-        terms.model_dump.return_value = {
-            "licensee_name": "Acme Licensing Co.",
-            "royalty_rate": "8%",
-            "royalty_base": "net sales",
-            "territories": ["Worldwide"],
-            "contract_start_date": "2026-01-01",
-            "contract_end_date": "2026-12-31",
-            "minimum_guarantee": "10000",
-            "advance_payment": None,
-            "reporting_frequency": "quarterly",
-        }
-        token_usage = {"input_tokens": 200, "output_tokens": 150, "total_tokens": 350}
-        return terms, token_usage
-
     # -----------------------------------------------------------------------
     # POST /api/contracts/extract
     # -----------------------------------------------------------------------
 
-    def test_extract_returns_draft_contract_id(self, client):
+    @pytest.fixture
+    def extract_pipeline(self):
+        """Patch the /extract route's storage, Claude and normaliser calls at once."""
+        with patch.multiple(
+            "app.routers.contracts",
+            upload_contract_pdf=DEFAULT,
+            get_signed_url=DEFAULT,
+            extract_contract=DEFAULT,
+            normalize_extracted_terms=DEFAULT,
+        ) as mocks:
+            yield SimpleNamespace(**mocks)
+
+    async def test_extract_returns_draft_contract_id(
+        self, async_client, contracts_db, extract_pipeline
+    ):
         """
         Posting a PDF to /extract should:
         - Upload to storage
@@ -308,30 +614,19 @@ class TestContractUploadFlow:
             filename="license.pdf",
         )
 
-        terms_mock, token_usage = self._extracted_terms_mock()
-        form_values_mock = MagicMock()
-        form_values_mock.model_dump.return_value = {"licensee_name": "Acme Licensing Co."}
-
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.supabase_admin") as mock_db:
-                self._mock_no_duplicate(mock_db)
-                self._mock_draft_insert(mock_db, draft_row)
-
-                with patch("app.routers.contracts.upload_contract_pdf") as mock_upload, \
-                     patch("app.routers.contracts.get_signed_url") as mock_url, \
-                     patch("app.routers.contracts.extract_contract") as mock_extract, \
-                     patch("app.routers.contracts.normalize_extracted_terms") as mock_norm:
+        # No duplicate filename; the INSERT returns the draft row
+        contracts_db.set_rows(select=[], insert=[draft_row])
 
-                    mock_upload.return_value = f"contracts/{user_id}/license.pdf"
-                    mock_url.return_value = "https://storage.example.com/license.pdf"
-                    mock_extract.return_value = (terms_mock, token_usage)
-                    mock_norm.return_value = form_values_mock
+        extract_pipeline.upload_contract_pdf.return_value = f"contracts/{user_id}/license.pdf"
+        extract_pipeline.get_signed_url.return_value = "https://storage.example.com/license.pdf"
+        extract_pipeline.extract_contract.return_value = (_EXTRACTED_TERMS, dict(_TOKEN_USAGE))
+        extract_pipeline.normalize_extracted_terms.return_value = _FORM_VALUES
 
-                    response = client.post(
-                        "/api/contracts/extract",
-                        files=self._make_pdf_upload("license.pdf"),
-                        headers=_auth_header(user_id),
-                    )
+        response = await async_client.post(
+            "/api/contracts/extract",
+            content=_LICENSE_PDF_BODY,
+            headers={**_AUTH_HEADER, "Content-Type": _LICENSE_PDF_CONTENT_TYPE},
+        )
 
         assert response.status_code == 200, response.text
         data = response.json()
@@ -341,23 +636,21 @@ class TestContractUploadFlow:
         assert data["filename"] == "license.pdf"
         assert data["storage_path"] == f"contracts/{user_id}/license.pdf"
 
-    def test_extract_rejects_non_pdf_files(self, client):
+    async def test_extract_rejects_non_pdf_files(self, async_client):
         """Non-PDF files should be rejected with 400."""
-        user_id = "user-abc"
-
-        with _patch_auth(user_id):
-            response = client.post(
-                "/api/contracts/extract",
-                files={
-                    "file": ("report.xlsx", io.BytesIO(b"PK fake xlsx"), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
-                },
-                headers=_auth_header(user_id),
-            )
+        response = await async_client.post(
+            "/api/contracts/extract",
+            content=_REPORT_XLSX_BODY,
+            headers={**_AUTH_HEADER, "Content-Type": _REPORT_XLSX_CONTENT_TYPE},
+        )
 
-        assert response.status_code == 400
+        assert response.status_code == 400, response.text
         assert "PDF" in response.json()["detail"]
 
-    def test_extract_returns_409_on_duplicate_active_contract(self, client):
+    # The 409 branches run before any upload or extraction, so they call the
+    # route function directly instead of going through HTTP and multipart.
+
+    async def test_extract_returns_409_on_duplicate_active_contract(self, contracts_db):
         """
         Uploading a PDF with the same filename as an existing active contract
         should return 409 with code DUPLICATE_FILENAME.
@@ -370,26 +663,18 @@ class TestContractUploadFlow:
             status="active",
         )
 
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.supabase_admin") as mock_db:
-                # Return existing active contract on duplicate check
-                mock_db.table.return_value.select.return_value \
-                    .eq.return_value.ilike.return_value.execute.return_value = Mock(
-                        data=[existing]
-                    )
+        # Return existing active contract on duplicate check
+        contracts_db.set_rows(select=[existing])
 
-                response = client.post(
-                    "/api/contracts/extract",
-                    files=self._make_pdf_upload("license.pdf"),
-                    headers=_auth_header(user_id),
-                )
+        with pytest.raises(HTTPException) as exc_info:
+            await extract_contract_terms(file=_pdf_upload_file("license.pdf"), user_id=user_id)
 
-        assert response.status_code == 409
-        detail = response.json()["detail"]
+        assert exc_info.value.status_code == 409
+        detail = exc_info.value.detail
         assert detail["code"] == "DUPLICATE_FILENAME"
         assert detail["existing_contract"]["id"] == "existing-001"
 
-    def test_extract_returns_409_on_incomplete_draft(self, client):
+    async def test_extract_returns_409_on_incomplete_draft(self, contracts_db):
         """
         Uploading a PDF matching an existing draft should return 409 with
         code INCOMPLETE_DRAFT so the frontend can redirect to review.
@@ -401,36 +686,19 @@ class TestContractUploadFlow:
             filename="license.pdf",
         )
 
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.supabase_admin") as mock_db:
-                mock_db.table.return_value.select.return_value \
-                    .eq.return_value.ilike.return_value.execute.return_value = Mock(
-                        data=[existing_draft]
-                    )
+        contracts_db.set_rows(select=[existing_draft])
 
-                response = client.post(
-                    "/api/contracts/extract",
-                    files=self._make_pdf_upload("license.pdf"),
-                    headers=_auth_header(user_id),
-                )
+        with pytest.raises(HTTPException) as exc_info:
+            await extract_contract_terms(file=_pdf_upload_file("license.pdf"), user_id=user_id)
 
-        assert response.status_code == 409
-        detail = response.json()["detail"]
-        assert detail["code"] == "INCOMPLETE_DRAFT"
-
-    def test_extract_requires_authentication(self, client):
-        """POST /extract without auth should return 401."""
-        response = client.post(
-            "/api/contracts/extract",
-            files=self._make_pdf_upload(),
-        )
-        assert response.status_code == 401
+        assert exc_info.value.status_code == 409
+        assert exc_info.value.detail["code"] == "INCOMPLETE_DRAFT"
 
     # -----------------------------------------------------------------------
     # PUT /api/contracts/{id}/confirm
     # -----------------------------------------------------------------------
 
-    def test_confirm_promotes_draft_to_active(self, client):
+    async def test_confirm_promotes_draft_to_active(self, async_client, contracts_db):
         """
         PUT /{id}/confirm should update status from draft → active and
         return the full active contract.
@@ -444,127 +712,42 @@ class TestContractUploadFlow:
         draft_row = _make_db_draft_contract(contract_id=contract_id, user_id=user_id)
         active_row = _make_db_contract(contract_id=contract_id, user_id=user_id)
 
-        confirm_payload = {
-            "licensee_name": "Acme Licensing Co.",
-            "licensee_email": "acme@example.com",
-            "royalty_rate": "8%",
-            "royalty_base": "net_sales",
-            "territories": ["Worldwide"],
-            "product_categories": None,
-            "contract_start_date": "2026-01-01",
-            "contract_end_date": "2026-12-31",
-            "minimum_guarantee": "10000.00",
-            "minimum_guarantee_period": "annually",
-            "advance_payment": None,
-            "reporting_frequency": "quarterly",
-        }
-
-        with _patch_auth(user_id):
-            # Patch verify_contract_ownership to bypass auth DB call
-            with patch("app.routers.contracts.verify_contract_ownership",
-                       new=AsyncMock(return_value=draft_row)):
-                with patch("app.routers.contracts.supabase_admin") as mock_db:
-                    # agreement_number sequence query (no existing numbers)
-                    seq_chain = MagicMock()
-                    seq_chain.execute.return_value = Mock(data=[])
-                    seq_chain.eq.return_value = seq_chain
-                    seq_chain.like.return_value = seq_chain
-                    seq_chain.order.return_value = seq_chain
-                    seq_chain.limit.return_value = seq_chain
-
-                    # UPDATE returns active row
-                    update_chain = MagicMock()
-                    update_chain.eq.return_value.execute.return_value = Mock(data=[active_row])
-
-                    contracts_table = MagicMock()
-                    contracts_table.select.return_value = seq_chain
-                    contracts_table.update.return_value = update_chain
-
-                    mock_db.table.return_value = contracts_table
-
-                    response = client.put(
-                        f"/api/contracts/{contract_id}/confirm",
-                        json=confirm_payload,
-                        headers=_auth_header(user_id),
-                    )
+        # Patch verify_contract_ownership to bypass auth DB call
+        with patch("app.routers.contracts.verify_contract_ownership",
+                   new=_async_return(draft_row)):
+            # agreement_number sequence query finds no existing numbers;
+            # the UPDATE returns the active row
+            contracts_db.set_rows(select=[], update=[active_row])
+
+            response = await async_client.put(
+                f"/api/contracts/{contract_id}/confirm",
+                content=_CONFIRM_BODY_ACME,
+                headers=_JSON_AUTH_HEADER,
+            )
 
         assert response.status_code == 200, response.text
         data = response.json()
         assert data["id"] == contract_id
         assert data["status"] == "active"
 
-    def test_confirm_returns_409_if_already_active(self, client):
+    async def test_confirm_returns_409_if_already_active(self, async_client):
         """Confirming an already-active contract should return 409."""
         user_id = "user-abc"
         contract_id = "active-001"
         active_row = _make_db_contract(contract_id=contract_id, user_id=user_id, status="active")
 
-        confirm_payload = {
-            "licensee_name": "Acme",
-            "licensee_email": None,
-            "royalty_rate": "8%",
-            "royalty_base": "net_sales",
-            "territories": [],
-            "product_categories": None,
-            "contract_start_date": "2026-01-01",
-            "contract_end_date": "2026-12-31",
-            "minimum_guarantee": "0",
-            "minimum_guarantee_period": "annually",
-            "advance_payment": None,
-            "reporting_frequency": "quarterly",
-        }
-
         # verify_contract_ownership returns the already-active row
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.verify_contract_ownership",
-                       new=AsyncMock(return_value=active_row)):
-                response = client.put(
-                    f"/api/contracts/{contract_id}/confirm",
-                    json=confirm_payload,
-                    headers=_auth_header(user_id),
-                )
+        with patch("app.routers.contracts.verify_contract_ownership",
+                   new=_async_return(active_row)):
+            response = await async_client.put(
+                f"/api/contracts/{contract_id}/confirm",
+                content=_CONFIRM_BODY_MINIMAL,
+                headers=_JSON_AUTH_HEADER,
+            )
 
         assert response.status_code == 409
 
-    def test_confirm_returns_403_if_not_owner(self, client):
-        """User cannot confirm a contract they do not own (403)."""
-        from fastapi import HTTPException
-
-        owner_id = "user-owner"
-        requester_id = "user-other"
-        contract_id = "contract-owned"
-
-        confirm_payload = {
-            "licensee_name": "Test",
-            "licensee_email": None,
-            "royalty_rate": "8%",
-            "royalty_base": "net_sales",
-            "territories": [],
-            "product_categories": None,
-            "contract_start_date": "2026-01-01",
-            "contract_end_date": "2026-12-31",
-            "minimum_guarantee": "0",
-            "minimum_guarantee_period": "annually",
-            "advance_payment": None,
-            "reporting_frequency": "quarterly",
-        }
-
-        # Simulate verify_contract_ownership raising 403
-        async def _raise_403(*args, **kwargs):
-            raise HTTPException(status_code=403, detail="You are not authorized to access this contract")
-
-        with _patch_auth(requester_id):
-            with patch("app.routers.contracts.verify_contract_ownership",
-                       side_effect=_raise_403):
-                response = client.put(
-                    f"/api/contracts/{contract_id}/confirm",
-                    json=confirm_payload,
-                    headers=_auth_header(requester_id),
-                )
-
-        assert response.status_code == 403
-
-    def test_list_contracts_returns_only_active_by_default(self, client):
+    async def test_list_contracts_returns_only_active_by_default(self, async_client):
         """GET /api/contracts/ should return only active contracts."""
         user_id = "user-abc"
         contracts = [
@@ -572,45 +755,44 @@ class TestContractUploadFlow:
             _make_db_contract(contract_id="c-2", user_id=user_id),
         ]
 
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.supabase_admin") as mock_db:
-                mock_db.table.return_value.select.return_value \
-                    .eq.return_value.eq.return_value.execute.return_value = Mock(data=contracts)
-
-                response = client.get(
-                    "/api/contracts/",
-                    headers=_auth_header(user_id),
-                )
+        with patch("app.routers.contracts.supabase_admin", _SupaChain(contracts)):
+            response = await async_client.get(
+                "/api/contracts/",
+                headers=_AUTH_HEADER,
+            )
 
         assert response.status_code == 200
         result = response.json()
         assert len(result) == 2
         assert all(c["status"] == "active" for c in result)
 
-    def test_get_single_contract_returns_404_for_unknown_id(self, client):
-        """GET /api/contracts/{unknown-id} should return 404."""
-        from fastapi import HTTPException
-
-        user_id = "user-abc"
-
-        async def _raise_404(*args, **kwargs):
-            raise HTTPException(status_code=404, detail="Contract not found")
-
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.verify_contract_ownership",
-                       side_effect=_raise_404):
-                response = client.get(
-                    "/api/contracts/does-not-exist",
-                    headers=_auth_header(user_id),
-                )
-
-        assert response.status_code == 404
+    @pytest.mark.parametrize(
+        "method, url, payload, patch_target, exc, expected_status",
+        [
+            pytest.param("POST", "/api/contracts/extract", None, None, None, 401,
+                         id="extract-requires-auth"),
+            pytest.param("PUT", "/api/contracts/contract-owned/confirm", _CONFIRM_PAYLOAD_MINIMAL,
+                         "app.routers.contracts.verify_contract_ownership", _FORBIDDEN, 403,
+                         id="confirm-not-owner"),
+            pytest.param("GET", "/api/contracts/does-not-exist", None,
+                         "app.routers.contracts.verify_contract_ownership", _NOT_FOUND, 404,
+                         id="get-unknown-contract"),
+        ],
+    )
+    async def test_contract_endpoint_error_status(
+        self, async_client, method, url, payload, patch_target, exc, expected_status,
+    ):
+        """Unauthenticated, non-owner and unknown-contract requests are rejected."""
+        await _assert_error_status(
+            async_client, method, url, payload, patch_target, exc, expected_status,
+        )
 
 
 # ===========================================================================
 # 3. Sales period create → YTD summary
 # ===========================================================================
 
+@pytest.mark.usefixtures("current_user")
 class TestSalesPeriodFlow:
     """
     End-to-end flow: POST /api/sales/ → GET /api/sales/summary/{contract_id}.
@@ -618,47 +800,15 @@ class TestSalesPeriodFlow:
     Royalty calculations are exercised with real logic (not mocked).
     """
 
-    def _make_supabase_for_create(self, mock_db, contract_row: dict, period_row: dict):
-        """
-        Set up the Supabase mock chain for POST /api/sales/:
-          1. verify_contract_ownership (SELECT contracts by id)
-          2. fetch contract for royalty calc (SELECT contracts by id again)
-          3. INSERT sales period
-        """
-        ownership_chain = MagicMock()
-        ownership_chain.execute.return_value = Mock(data=[contract_row])
-        ownership_chain.select.return_value = ownership_chain
-        ownership_chain.eq.return_value = ownership_chain
-
-        insert_chain = MagicMock()
-        insert_chain.execute.return_value = Mock(data=[period_row])
-
-        def table_side_effect(name):
-            if name == "contracts":
-                return ownership_chain
-            if name == "sales_periods":
-                t = MagicMock()
-                t.insert.return_value = insert_chain
-                return t
-            return MagicMock()
-
-        mock_db.table.side_effect = table_side_effect
-
-    def test_create_sales_period_calculates_royalty(self, client):
+    async def test_create_sales_period_calculates_royalty(self, async_client, sales_db):
         """
         POST /api/sales/ with valid data should:
         - Verify contract ownership
         - Calculate royalty (8% of $100,000 = $8,000)
         - Persist and return the sales period
         """
-        user_id = "user-abc"
         contract_id = "contract-abc"
-        contract = _make_db_contract(
-            contract_id=contract_id,
-            user_id=user_id,
-            royalty_rate="8%",
-            minimum_guarantee="0",
-        )
+        contract = _DEFAULT_CONTRACT
         period_row = _make_db_sales_period(
             contract_id=contract_id,
             net_sales="100000",
@@ -666,534 +816,288 @@ class TestSalesPeriodFlow:
         )
 
         payload = {
-            "contract_id": contract_id,
-            "period_start": "2026-01-01",
-            "period_end": "2026-03-31",
+            **_SALES_PAYLOAD,
             "net_sales": "100000.00",
             "category_breakdown": None,
             "licensee_reported_royalty": None,
         }
 
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.verify_contract_ownership",
-                       new=AsyncMock(return_value=contract)):
-                with patch("app.routers.sales.supabase") as mock_db:
-                    def table_side_effect(name):
-                        t = MagicMock()
-                        if name == "contracts":
-                            t.select.return_value.eq.return_value.execute.return_value = Mock(
-                                data=[contract]
-                            )
-                        elif name == "sales_periods":
-                            t.insert.return_value.execute.return_value = Mock(data=[period_row])
-                        return t
-
-                    mock_db.table.side_effect = table_side_effect
-
-                    response = client.post(
-                        "/api/sales/",
-                        json=payload,
-                        headers=_auth_header(user_id),
-                    )
-
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert data["contract_id"] == contract_id
-        assert Decimal(str(data["royalty_calculated"])) == Decimal("8000")
+        sales_db.set_rows(contracts=[contract], sales_periods=[period_row])
 
-    def test_create_sales_period_requires_auth(self, client):
-        """POST /api/sales/ without auth should return 401."""
-        response = client.post(
+        response = await async_client.post(
             "/api/sales/",
-            json={
-                "contract_id": "c-1",
-                "period_start": "2026-01-01",
-                "period_end": "2026-03-31",
-                "net_sales": "100000",
-            },
+            json=payload,
+            headers=_AUTH_HEADER,
         )
-        assert response.status_code == 401
-
-    def test_create_sales_period_returns_403_if_not_owner(self, client):
-        """POST /api/sales/ for another user's contract should return 403."""
-        from fastapi import HTTPException
-
-        requester_id = "user-other"
 
-        async def _raise_403(*args, **kwargs):
-            raise HTTPException(status_code=403, detail="You are not authorized to access this contract")
-
-        payload = {
-            "contract_id": "contract-abc",
-            "period_start": "2026-01-01",
-            "period_end": "2026-03-31",
-            "net_sales": "100000",
-        }
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["contract_id"] == contract_id
+        assert _as_decimal(data["royalty_calculated"]) == _ROYALTY_8PCT_OF_100K
 
-        with _patch_auth(requester_id):
-            with patch("app.routers.sales.verify_contract_ownership",
-                       side_effect=_raise_403):
-                response = client.post(
-                    "/api/sales/",
-                    json=payload,
-                    headers=_auth_header(requester_id),
-                )
+    @pytest.fixture
+    def ytd_case(self, request):
+        """
+        Build (contract, periods, expected) for one YTD summary scenario.
 
-        assert response.status_code == 403
+        Used with indirect parametrization; only the requested scenario's rows
+        are built.
 
-    def test_ytd_summary_sums_periods_correctly(self, client):
+        basic_ytd: two periods, $100,000 + $150,000 = $250,000 net sales;
+            royalty at 8% is $8,000 + $12,000 = $20,000, no minimum.
+        mg_shortfall: annual minimum $25,000, calculated $8,000, so the
+            shortfall is $17,000.
         """
-        GET /api/sales/summary/{contract_id} should aggregate multiple periods
-        and return correct YTD totals.
+        first_quarter = dict(period_id="sp-1", net_sales="100000", royalty_calculated="8000")
+        if request.param == "basic_ytd":
+            contract = _DEFAULT_CONTRACT
+            periods = [
+                _make_db_sales_period(**first_quarter),
+                _make_db_sales_period(
+                    period_id="sp-2",
+                    period_start="2026-04-01",
+                    period_end="2026-06-30",
+                    net_sales="150000",
+                    royalty_calculated="12000",
+                ),
+            ]
+            expected = {
+                "total_sales_ytd": _YTD_SALES_TWO_PERIODS,
+                "total_royalties_ytd": _YTD_ROYALTIES_TWO_PERIODS,
+                "shortfall": _ZERO,
+            }
+        else:
+            contract = _make_db_contract(
+                contract_id="contract-mg",
+                royalty_rate="8%",
+                minimum_guarantee="25000",
+                minimum_guarantee_period="annually",
+            )
+            periods = [_make_db_sales_period(contract_id="contract-mg", **first_quarter)]
+            expected = {"minimum_guarantee_ytd": _MG_YTD, "shortfall": _MG_SHORTFALL}
+        return contract, periods, expected
 
-        Two periods: $100,000 + $150,000 = $250,000 net sales.
-        Royalty at 8%: $8,000 + $12,000 = $20,000.
+    @pytest.mark.parametrize("ytd_case", ["basic_ytd", "mg_shortfall"], indirect=True)
+    async def test_ytd_summary_totals(self, async_client, sales_db, ytd_case):
         """
-        user_id = "user-abc"
-        contract_id = "contract-abc"
-        contract = _make_db_contract(
-            contract_id=contract_id,
-            user_id=user_id,
-            royalty_rate="8%",
-            minimum_guarantee="0",
-        )
-        periods = [
-            _make_db_sales_period(
-                period_id="sp-1",
-                contract_id=contract_id,
-                net_sales="100000",
-                royalty_calculated="8000",
-            ),
-            _make_db_sales_period(
-                period_id="sp-2",
-                contract_id=contract_id,
-                period_start="2026-04-01",
-                period_end="2026-06-30",
-                net_sales="150000",
-                royalty_calculated="12000",
-            ),
-        ]
-
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.verify_contract_ownership",
-                       new=AsyncMock(return_value=None)):
-                with patch("app.routers.sales.supabase") as mock_db:
-                    def table_side_effect(name):
-                        t = MagicMock()
-                        if name == "contracts":
-                            t.select.return_value.eq.return_value.execute.return_value = Mock(
-                                data=[contract]
-                            )
-                        elif name == "sales_periods":
-                            t.select.return_value.eq.return_value.execute.return_value = Mock(
-                                data=periods
-                            )
-                        return t
-
-                    mock_db.table.side_effect = table_side_effect
-
-                    response = client.get(
-                        f"/api/sales/summary/{contract_id}",
-                        headers=_auth_header(user_id),
-                    )
-
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert data["contract_id"] == contract_id
-        assert Decimal(str(data["total_sales_ytd"])) == Decimal("250000")
-        assert Decimal(str(data["total_royalties_ytd"])) == Decimal("20000")
-        assert Decimal(str(data["shortfall"])) == Decimal("0")
-
-    def test_ytd_summary_applies_minimum_guarantee(self, client):
+        GET /api/sales/summary/{contract_id} should aggregate the contract's
+        periods into YTD totals and apply the minimum guarantee.
         """
-        When calculated royalty is below the minimum guarantee, shortfall
-        should be positive.
+        contract, periods, expected = ytd_case
+        contract_id = contract["id"]
 
-        Annual minimum: $25,000. Calculated: $8,000. Shortfall: $17,000.
-        """
-        user_id = "user-abc"
-        contract_id = "contract-mg"
-        contract = _make_db_contract(
-            contract_id=contract_id,
-            user_id=user_id,
-            royalty_rate="8%",
-            minimum_guarantee="25000",
-            minimum_guarantee_period="annually",
-        )
-        periods = [
-            _make_db_sales_period(
-                period_id="sp-1",
-                contract_id=contract_id,
-                net_sales="100000",
-                royalty_calculated="8000",
-            ),
-        ]
+        sales_db.set_rows(contracts=[contract], sales_periods=periods)
 
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.verify_contract_ownership",
-                       new=AsyncMock(return_value=None)):
-                with patch("app.routers.sales.supabase") as mock_db:
-                    def table_side_effect(name):
-                        t = MagicMock()
-                        if name == "contracts":
-                            t.select.return_value.eq.return_value.execute.return_value = Mock(
-                                data=[contract]
-                            )
-                        elif name == "sales_periods":
-                            t.select.return_value.eq.return_value.execute.return_value = Mock(
-                                data=periods
-                            )
-                        return t
-
-                    mock_db.table.side_effect = table_side_effect
-
-                    response = client.get(
-                        f"/api/sales/summary/{contract_id}",
-                        headers=_auth_header(user_id),
-                    )
+        response = await async_client.get(
+            f"/api/sales/summary/{contract_id}",
+            headers=_AUTH_HEADER,
+        )
 
         assert response.status_code == 200, response.text
         data = response.json()
-        assert Decimal(str(data["minimum_guarantee_ytd"])) == Decimal("25000")
-        assert Decimal(str(data["shortfall"])) == Decimal("17000")
-
-    def test_ytd_summary_returns_404_for_unknown_contract(self, client):
-        """GET /api/sales/summary/{unknown} should return 404."""
-        from fastapi import HTTPException
-
-        user_id = "user-abc"
-
-        async def _raise_404(*args, **kwargs):
-            raise HTTPException(status_code=404, detail="Contract not found")
-
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.verify_contract_ownership",
-                       side_effect=_raise_404):
-                response = client.get(
-                    "/api/sales/summary/does-not-exist",
-                    headers=_auth_header(user_id),
-                )
-
-        assert response.status_code == 404
+        assert data["contract_id"] == contract_id
+        for field, amount in expected.items():
+            assert _as_decimal(data[field]) == amount, field
 
-    def test_list_sales_periods_for_contract(self, client):
+    async def test_list_sales_periods_for_contract(self, async_client, sales_db):
         """GET /api/sales/contract/{id} should return all periods in desc order."""
-        user_id = "user-abc"
         contract_id = "contract-abc"
-        contract = _make_db_contract(contract_id=contract_id, user_id=user_id)
         periods = [
             _make_db_sales_period(period_id="sp-2", contract_id=contract_id, period_start="2026-04-01"),
             _make_db_sales_period(period_id="sp-1", contract_id=contract_id),
         ]
+        sales_db.set_rows(sales_periods=periods)
 
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.verify_contract_ownership",
-                       new=AsyncMock(return_value=contract)):
-                with patch("app.routers.sales.supabase") as mock_db:
-                    t = MagicMock()
-                    t.select.return_value.eq.return_value.order.return_value.execute.return_value = Mock(
-                        data=periods
-                    )
-                    mock_db.table.return_value = t
-
-                    response = client.get(
-                        f"/api/sales/contract/{contract_id}",
-                        headers=_auth_header(user_id),
-                    )
+        response = await async_client.get(
+            f"/api/sales/contract/{contract_id}",
+            headers=_AUTH_HEADER,
+        )
 
         assert response.status_code == 200, response.text
         data = response.json()
         assert len(data) == 2
 
+    @pytest.mark.parametrize(
+        "method, url, payload, patch_target, exc, expected_status",
+        [
+            pytest.param("POST", "/api/sales/", _SALES_PAYLOAD, None, None, 401,
+                         id="create-requires-auth"),
+            pytest.param("POST", "/api/sales/", _SALES_PAYLOAD,
+                         "app.routers.sales.verify_contract_ownership", _FORBIDDEN, 403,
+                         id="create-not-owner"),
+            pytest.param("GET", "/api/sales/summary/does-not-exist", None,
+                         "app.routers.sales.verify_contract_ownership", _NOT_FOUND, 404,
+                         id="summary-unknown-contract"),
+        ],
+    )
+    async def test_sales_endpoint_error_status(
+        self, async_client, method, url, payload, patch_target, exc, expected_status,
+    ):
+        """Unauthenticated, non-owner and unknown-contract requests are rejected."""
+        await _assert_error_status(
+            async_client, method, url, payload, patch_target, exc, expected_status,
+        )
+
 
 # ===========================================================================
 # 4. Discrepancy calculation end-to-end
 # ===========================================================================
 
+@pytest.mark.usefixtures("current_user")
 class TestDiscrepancyFlow:
     """
     Verify that the discrepancy fields (discrepancy_amount, has_discrepancy)
     are computed correctly when a licensee_reported_royalty is provided.
     """
 
-    def _post_period(self, client, user_id: str, contract_row: dict, period_row: dict,
-                     payload: dict) -> dict:
-        """
-        Helper: POST /api/sales/ with ownership and DB mocked.
-        Returns the parsed JSON response body.
-        """
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.verify_contract_ownership",
-                       new=AsyncMock(return_value=contract_row)):
-                with patch("app.routers.sales.supabase") as mock_db:
-                    def table_side_effect(name):
-                        t = MagicMock()
-                        if name == "contracts":
-                            t.select.return_value.eq.return_value.execute.return_value = Mock(
-                                data=[contract_row]
-                            )
-                        elif name == "sales_periods":
-                            t.insert.return_value.execute.return_value = Mock(data=[period_row])
-                        return t
-
-                    mock_db.table.side_effect = table_side_effect
-
-                    response = client.post(
-                        "/api/sales/",
-                        json=payload,
-                        headers=_auth_header(user_id),
-                    )
-
-        assert response.status_code == 200, response.text
-        return response.json()
-
-    def test_no_discrepancy_when_reported_matches_calculated(self, client):
-        """
-        When licensee_reported_royalty == royalty_calculated, has_discrepancy
-        must be False and discrepancy_amount must be 0.
-        """
-        user_id = "user-abc"
-        contract_id = "contract-abc"
-        contract = _make_db_contract(contract_id=contract_id, user_id=user_id, royalty_rate="8%")
-        period_row = _make_db_sales_period(
-            contract_id=contract_id,
-            net_sales="100000",
-            royalty_calculated="8000",
-            licensee_reported_royalty="8000",  # exact match
-        )
-
-        payload = {
-            "contract_id": contract_id,
-            "period_start": "2026-01-01",
-            "period_end": "2026-03-31",
-            "net_sales": "100000",
-            "licensee_reported_royalty": "8000",
-        }
-
-        data = self._post_period(client, user_id, contract, period_row, payload)
-        assert data["has_discrepancy"] is False
-        assert Decimal(str(data["discrepancy_amount"])) == Decimal("0")
+    # (case, reported, calculated, expected discrepancy_amount, has_discrepancy)
+    _CASES = [
+        # Exact match: no discrepancy.
+        ("matches", "8000", "8000", _ZERO, False),
+        # Under-reported: licensor is owed more. $8,000 - $7,500 = +$500.
+        ("under-reported", "7500", "8000", _UNDER_REPORTED_BY, True),
+        # Over-reported: licensee overpaid. $8,000 - $9,000 = -$1,000.
+        ("over-reported", "9000", "8000", _OVER_REPORTED_BY, True),
+        # Nothing reported: no discrepancy fields.
+        ("not-reported", None, "8000", None, False),
+    ]
+
+    # Each case's request body, encoded once.
+    _BODIES = {
+        case: _sales_body() if reported is None else _sales_body(licensee_reported_royalty=reported)
+        for case, reported, *_ in _CASES
+    }
 
-    def test_positive_discrepancy_when_licensee_under_reports(self, client):
+    async def test_discrepancy_table(self, async_client, sales_db):
         """
-        When licensee_reported_royalty < royalty_calculated, the discrepancy
-        is positive (licensor is owed more than reported).
+        POST /api/sales/ should report discrepancy_amount as calculated minus
+        reported royalty, and has_discrepancy when they differ.
 
-        Calculated: $8,000. Reported: $7,500. Discrepancy: +$500.
+        All cases run in one test and every mismatch is reported together.
         """
-        user_id = "user-abc"
-        contract_id = "contract-abc"
-        contract = _make_db_contract(contract_id=contract_id, user_id=user_id, royalty_rate="8%")
-        period_row = _make_db_sales_period(
-            contract_id=contract_id,
-            net_sales="100000",
-            royalty_calculated="8000",
-            licensee_reported_royalty="7500",
-        )
+        failures = []
+        for case, reported, calculated, amount, flag in self._CASES:
+            period_row = _make_db_sales_period(
+                net_sales="100000",
+                royalty_calculated=calculated,
+                licensee_reported_royalty=reported,
+            )
+            sales_db.set_rows(contracts=[_DEFAULT_CONTRACT], sales_periods=[period_row])
 
-        payload = {
-            "contract_id": contract_id,
-            "period_start": "2026-01-01",
-            "period_end": "2026-03-31",
-            "net_sales": "100000",
-            "licensee_reported_royalty": "7500",
-        }
+            response = await async_client.post(
+                "/api/sales/", content=self._BODIES[case], headers=_JSON_AUTH_HEADER,
+            )
 
-        data = self._post_period(client, user_id, contract, period_row, payload)
-        assert data["has_discrepancy"] is True
-        assert Decimal(str(data["discrepancy_amount"])) == Decimal("500")
+            if response.status_code != 200:
+                failures.append((case, response.status_code, response.text))
+                continue
+            data = response.json()
+            got = (_as_decimal(data["discrepancy_amount"]), data["has_discrepancy"])
+            if got != (amount, flag):
+                failures.append((case, got, (amount, flag)))
 
-    def test_negative_discrepancy_when_licensee_over_reports(self, client):
-        """
-        When licensee_reported_royalty > royalty_calculated, the discrepancy
-        is negative (licensor owes back or licensee overpaid).
+        assert not failures, failures
 
-        Calculated: $8,000. Reported: $9,000. Discrepancy: -$1,000.
-        """
-        user_id = "user-abc"
-        contract_id = "contract-abc"
-        contract = _make_db_contract(contract_id=contract_id, user_id=user_id, royalty_rate="8%")
-        period_row = _make_db_sales_period(
-            contract_id=contract_id,
-            net_sales="100000",
-            royalty_calculated="8000",
-            licensee_reported_royalty="9000",
-        )
 
-        payload = {
-            "contract_id": contract_id,
-            "period_start": "2026-01-01",
-            "period_end": "2026-03-31",
-            "net_sales": "100000",
-            "licensee_reported_royalty": "9000",
-        }
+# ===========================================================================
+# 5. Dashboard summary
+# ===========================================================================
 
-        data = self._post_period(client, user_id, contract, period_row, payload)
-        assert data["has_discrepancy"] is True
-        assert Decimal(str(data["discrepancy_amount"])) == Decimal("-1000")
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned to mid-2026 so the dashboard's year is fixed."""
 
-    def test_no_discrepancy_fields_when_no_reported_royalty(self, client):
-        """
-        When no licensee_reported_royalty is provided, discrepancy_amount is
-        None and has_discrepancy is False.
-        """
-        user_id = "user-abc"
-        contract_id = "contract-abc"
-        contract = _make_db_contract(contract_id=contract_id, user_id=user_id, royalty_rate="8%")
-        period_row = _make_db_sales_period(
-            contract_id=contract_id,
-            net_sales="100000",
-            royalty_calculated="8000",
-            licensee_reported_royalty=None,
-        )
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 6, 15, tzinfo=tz)
 
-        payload = {
-            "contract_id": contract_id,
-            "period_start": "2026-01-01",
-            "period_end": "2026-03-31",
-            "net_sales": "100000",
-        }
 
-        data = self._post_period(client, user_id, contract, period_row, payload)
-        assert data["has_discrepancy"] is False
-        assert data["discrepancy_amount"] is None
+@pytest.fixture
+def frozen_clock():
+    """Pin app.routers.sales' clock to 2026-06-15."""
+    with patch("app.routers.sales.datetime", _FrozenDatetime):
+        yield
 
 
-# ===========================================================================
-# 5. Dashboard summary
-# ===========================================================================
-
+@pytest.mark.usefixtures("current_user", "frozen_clock")
 class TestDashboardSummary:
     """
     Verify GET /api/sales/dashboard-summary returns correct YTD totals
     across multiple contracts.
     """
 
-    def test_dashboard_summary_returns_zero_with_no_contracts(self, client):
-        """User with no active contracts should get ytd_royalties = 0."""
-        user_id = "user-abc"
-
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.supabase") as mock_db:
-                def table_side_effect(name):
-                    t = MagicMock()
-                    if name == "contracts":
-                        t.select.return_value.eq.return_value.eq.return_value.execute.return_value = Mock(
-                            data=[]
-                        )
-                    return t
-
-                mock_db.table.side_effect = table_side_effect
-
-                response = client.get(
-                    "/api/sales/dashboard-summary",
-                    headers=_auth_header(user_id),
-                )
-
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert Decimal(str(data["ytd_royalties"])) == Decimal("0")
-
-    def test_dashboard_summary_sums_across_all_active_contracts(self, client):
-        """
-        User has two contracts; periods total $8,000 + $12,000 = $20,000.
-        """
-        user_id = "user-abc"
-        current_year = 2026
-
-        with _patch_auth(user_id):
-            with patch("app.routers.sales.supabase") as mock_db:
-                def table_side_effect(name):
-                    t = MagicMock()
-                    if name == "contracts":
-                        t.select.return_value.eq.return_value.eq.return_value.execute.return_value = Mock(
-                            data=[
-                                {"id": "c-1"},
-                                {"id": "c-2"},
-                            ]
-                        )
-                    elif name == "sales_periods":
-                        t.select.return_value.in_.return_value.gte.return_value.execute.return_value = Mock(
-                            data=[
-                                {"royalty_calculated": "8000"},
-                                {"royalty_calculated": "12000"},
-                            ]
-                        )
-                    return t
-
-                mock_db.table.side_effect = table_side_effect
-
-                response = client.get(
-                    "/api/sales/dashboard-summary",
-                    headers=_auth_header(user_id),
-                )
+    @pytest.mark.parametrize(
+        "contracts, periods, ytd",
+        [
+            # No active contracts: nothing to sum.
+            pytest.param([], [], _ZERO, id="no-contracts"),
+            # Two contracts; periods total $8,000 + $12,000 = $20,000.
+            pytest.param(
+                [{"id": "c-1"}, {"id": "c-2"}],
+                [{"royalty_calculated": "8000"}, {"royalty_calculated": "12000"}],
+                _YTD_ROYALTIES_TWO_PERIODS,
+                id="two-contracts",
+            ),
+        ],
+    )
+    async def test_dashboard_summary_ytd_royalties(
+        self, async_client, sales_db, contracts, periods, ytd,
+    ):
+        """ytd_royalties sums this year's periods across all active contracts."""
+        sales_db.set_rows(contracts=contracts, sales_periods=periods)
+
+        response = await async_client.get(
+            "/api/sales/dashboard-summary",
+            headers=_AUTH_HEADER,
+        )
 
         assert response.status_code == 200, response.text
         data = response.json()
-        assert Decimal(str(data["ytd_royalties"])) == Decimal("20000")
-        assert data["current_year"] == current_year
+        assert _as_decimal(data["ytd_royalties"]) == ytd
+        assert data["current_year"] == 2026
 
-    def test_dashboard_summary_requires_auth(self, client):
+    async def test_dashboard_summary_requires_auth(self, async_client):
         """GET /api/sales/dashboard-summary without auth should return 401."""
-        response = client.get("/api/sales/dashboard-summary")
-        assert response.status_code == 401
+        response = await _unauthenticated_request(async_client, "GET", "/api/sales/dashboard-summary")
+        assert response.status_code == 401, response.text
 
 
 # ===========================================================================
 # 6. Contract deletion with storage cleanup
 # ===========================================================================
 
+@pytest.mark.usefixtures("current_user")
 class TestContractDeletion:
     """Verify DELETE /api/contracts/{id} removes storage PDF and DB row."""
 
-    def test_delete_contract_removes_pdf_and_db_row(self, client):
+    async def test_delete_contract_removes_pdf_and_db_row(self, async_client, mock_contracts_db):
         """
         DELETE /{id} should call delete_contract_pdf and delete the DB row.
         Returns 200 with a confirmation message.
         """
-        user_id = "user-abc"
-        contract_id = "contract-abc"
-        contract = _make_db_contract(contract_id=contract_id, user_id=user_id)
+        mock_contracts_db.configure_success(_DEFAULT_CONTRACT)
 
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.verify_contract_ownership",
-                       new=AsyncMock(return_value=contract)):
-                with patch("app.routers.contracts.supabase_admin") as mock_db, \
-                     patch("app.routers.contracts.delete_contract_pdf") as mock_delete_pdf:
-
-                    # DELETE query
-                    mock_db.table.return_value.delete.return_value \
-                        .eq.return_value.execute.return_value = Mock(data=[contract])
-
-                    response = client.delete(
-                        f"/api/contracts/{contract_id}",
-                        headers=_auth_header(user_id),
-                    )
+        response = await async_client.delete(
+            "/api/contracts/contract-abc", headers=_AUTH_HEADER,
+        )
 
         assert response.status_code == 200, response.text
         assert response.json()["message"] == "Contract deleted"
-        mock_delete_pdf.assert_called_once()
+        mock_contracts_db.delete_pdf.assert_called_once()
 
-    def test_delete_contract_returns_404_for_unknown_id(self, client):
+    async def test_delete_contract_returns_404_for_unknown_id(self, async_client, mock_contracts_db):
         """DELETE on a non-existent contract should return 404."""
-        from fastapi import HTTPException
-
-        user_id = "user-abc"
-
-        async def _raise_404(*args, **kwargs):
-            raise HTTPException(status_code=404, detail="Contract not found")
+        mock_contracts_db.configure_404()
 
-        with _patch_auth(user_id):
-            with patch("app.routers.contracts.verify_contract_ownership",
-                       side_effect=_raise_404):
-                response = client.delete(
-                    "/api/contracts/does-not-exist",
-                    headers=_auth_header(user_id),
-                )
+        # Status-only check: the body is never decoded with .json(). The ASGI
+        # transport buffers it either way, so there is no cheaper read to use.
+        response = await async_client.delete(
+            "/api/contracts/does-not-exist", headers=_AUTH_HEADER,
+        )
 
-        assert response.status_code == 404
+        assert response.status_code == 404, response.text
+        mock_contracts_db.delete_pdf.assert_not_called()
 
-    def test_delete_contract_requires_auth(self, client):
+    async def test_delete_contract_requires_auth(self, async_client):
         """DELETE without auth should return 401."""
-        response = client.delete("/api/contracts/some-id")
-        assert response.status_code == 401
+        response = await _unauthenticated_request(async_client, "DELETE", "/api/contracts/some-id")
+        assert response.status_code == 401, response.text
@@ -5,6 +5,7 @@ Tests convert raw ExtractedTerms (Claude AI output) into FormValues
 that the frontend can bind directly to form inputs.
 """
 
+import json
 import pytest
 from app.models.contract import ExtractedTerms, FormValues
 from app.services.normalizer import (
@@ -566,8 +567,6 @@ class TestNormalizeExtractedTerms:
 
     def test_form_values_model_dump_is_serialisable(self):
         """form_values.model_dump() must be serialisable to JSON (used in API response)."""
-        import json
-
         terms = self._make_terms(
             licensee_name="Test Corp",
             royalty_rate="8% of net sales",
@@ -586,8 +585,6 @@ class TestNormalizeExtractedTerms:
 
     def test_tiered_rate_model_dump_is_serialisable(self):
         """Tiered-rate form_values must also be JSON serialisable."""
-        import json
-
         tiers = [
             {"threshold": "$0-$2,000,000", "rate": "6%"},
             {"threshold": "$2,000,000+", "rate": "8%"},
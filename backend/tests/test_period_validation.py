@@ -154,45 +154,43 @@ class TestExtractMetadataPeriods:
         assert start is None
         assert end is None
 
-    def test_extract_metadata_periods_all_start_label_variants(self):
+    @pytest.mark.parametrize("label", [
+        "reporting period start",
+        "period start",
+        "from",
+        "start date",
+        "period from",
+    ])
+    def test_extract_metadata_periods_all_start_label_variants(self, label):
         """All start label variants are recognised."""
         from app.services.spreadsheet_parser import _extract_metadata_periods
 
-        start_labels = [
-            "reporting period start",
-            "period start",
-            "from",
-            "start date",
-            "period from",
+        raw_rows = [
+            [label, "2025-01-01"],
+            ["Product", "Net Sales"],
         ]
-        for label in start_labels:
-            raw_rows = [
-                [label, "2025-01-01"],
-                ["Product", "Net Sales"],
-            ]
-            start, end = _extract_metadata_periods(raw_rows, header_idx=1)
-            assert start == "2025-01-01", f"Failed for label: {label!r}"
-
-    def test_extract_metadata_periods_all_end_label_variants(self):
+        start, end = _extract_metadata_periods(raw_rows, header_idx=1)
+        assert start == "2025-01-01"
+
+    @pytest.mark.parametrize("label", [
+        "reporting period end",
+        "period end",
+        "through",
+        "end date",
+        "period through",
+        "to",
+        "period to",
+    ])
+    def test_extract_metadata_periods_all_end_label_variants(self, label):
         """All end label variants are recognised."""
         from app.services.spreadsheet_parser import _extract_metadata_periods
 
-        end_labels = [
-            "reporting period end",
-            "period end",
-            "through",
-            "end date",
-            "period through",
-            "to",
-            "period to",
+        raw_rows = [
+            [label, "2025-03-31"],
+            ["Product", "Net Sales"],
         ]
-        for label in end_labels:
-            raw_rows = [
-                [label, "2025-03-31"],
-                ["Product", "Net Sales"],
-            ]
-            start, end = _extract_metadata_periods(raw_rows, header_idx=1)
-            assert end == "2025-03-31", f"Failed for label: {label!r}"
+        start, end = _extract_metadata_periods(raw_rows, header_idx=1)
+        assert end == "2025-03-31"
 
 
 # ---------------------------------------------------------------------------
@@ -10,8 +10,10 @@ Endpoints under test:
 
 import pytest
 import os
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
+from unittest.mock import patch, AsyncMock
+from datetime import datetime, timezone
 from decimal import Decimal
+from types import SimpleNamespace
 from fastapi import HTTPException
 
 # Mock environment variables before importing app modules
@@ -19,6 +21,9 @@ os.environ['SUPABASE_URL'] = 'https://test.supabase.co'
 os.environ['SUPABASE_KEY'] = 'test-anon-key'
 os.environ['SUPABASE_SERVICE_KEY'] = 'test-service-key'
 
+from app.auth import get_current_user
+from app.routers.sales import get_contract_totals, get_dashboard_summary
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -35,6 +40,29 @@ def _period_row(royalty_calculated: str, period_start: str) -> dict:
     }
 
 
+class _FakeQuery:
+    """
+    Hand-rolled Supabase query builder for one table.
+
+    Every builder method (select, eq, in_, gte, ...) returns self and
+    execute() returns the preconfigured rows. Builder method names are
+    recorded in .calls so tests can check whether a query was issued.
+    """
+
+    def __init__(self, data: list[dict]):
+        self._result = SimpleNamespace(data=data)
+        self.calls = []
+
+    def execute(self):
+        return self._result
+
+    def __getattr__(self, name):
+        def chain(*args, **kwargs):
+            self.calls.append(name)
+            return self
+        return chain
+
+
 # ---------------------------------------------------------------------------
 # GET /api/sales/dashboard-summary
 # ---------------------------------------------------------------------------
@@ -48,54 +76,24 @@ class TestGetDashboardSummaryEndpoint:
 
     def _setup_contracts_mock(self, mock_supabase, contract_ids: list[str]):
         """
-        Wire mock_supabase so that:
+        Stub for:
             table("contracts").select("id").eq(...).eq(...).execute()
-        returns a list of {id: ...} rows.
+        returning a list of {id: ...} rows.
         """
-        mock_exec = MagicMock()
-        mock_exec.execute.return_value = Mock(
-            data=[_contract_id_row(cid) for cid in contract_ids]
-        )
-        mock_eq2 = MagicMock()
-        mock_eq2.execute.return_value = mock_exec.execute.return_value
-        mock_eq1 = MagicMock()
-        mock_eq1.eq.return_value = mock_eq2
-        mock_select = MagicMock()
-        mock_select.eq.return_value = mock_eq1
-
-        mock_contracts_table = MagicMock()
-        mock_contracts_table.select.return_value = mock_select
-        return mock_contracts_table
+        return _FakeQuery([_contract_id_row(cid) for cid in contract_ids])
 
     def _setup_periods_mock(self, mock_supabase, period_rows: list[dict]):
         """
-        Wire mock_supabase so that:
+        Stub for:
             table("sales_periods").select("royalty_calculated").in_(...).gte(...).execute()
-        returns the given period rows.
+        returning the given period rows.
         """
-        mock_exec = MagicMock()
-        mock_exec.execute.return_value = Mock(data=period_rows)
-        mock_gte = MagicMock()
-        mock_gte.execute.return_value = mock_exec.execute.return_value
-        mock_in = MagicMock()
-        mock_in.gte.return_value = mock_gte
-        mock_select = MagicMock()
-        mock_select.in_.return_value = mock_in
-
-        mock_periods_table = MagicMock()
-        mock_periods_table.select.return_value = mock_select
-        return mock_periods_table
+        return _FakeQuery(period_rows)
 
     def _wire(self, mock_supabase, contracts_table, periods_table):
-        """Point mock_supabase.table() at the right table mock by name."""
-        def side_effect(table_name):
-            if table_name == "contracts":
-                return contracts_table
-            if table_name == "sales_periods":
-                return periods_table
-            return MagicMock()
-
-        mock_supabase.table.side_effect = side_effect
+        """Point mock_supabase.table() at the right table stub by name."""
+        tables = {"contracts": contracts_table, "sales_periods": periods_table}
+        mock_supabase.table.side_effect = tables.__getitem__
 
     # ------------------------------------------------------------------
     # Tests
@@ -111,7 +109,6 @@ class TestGetDashboardSummaryEndpoint:
             p_table = self._setup_periods_mock(mock_supabase, [])
             self._wire(mock_supabase, c_table, p_table)
 
-            from app.routers.sales import get_dashboard_summary
             result = await get_dashboard_summary(user_id="user-1")
 
         assert result.ytd_royalties == Decimal("0")
@@ -127,7 +124,6 @@ class TestGetDashboardSummaryEndpoint:
             p_table = self._setup_periods_mock(mock_supabase, [])
             self._wire(mock_supabase, c_table, p_table)
 
-            from app.routers.sales import get_dashboard_summary
             result = await get_dashboard_summary(user_id="user-1")
 
         assert result.ytd_royalties == Decimal("0")
@@ -151,7 +147,6 @@ class TestGetDashboardSummaryEndpoint:
             )
             self._wire(mock_supabase, c_table, p_table)
 
-            from app.routers.sales import get_dashboard_summary
             result = await get_dashboard_summary(user_id="user-1")
 
         assert result.ytd_royalties == Decimal("25000.50")
@@ -170,7 +165,6 @@ class TestGetDashboardSummaryEndpoint:
             )
             self._wire(mock_supabase, c_table, p_table)
 
-            from app.routers.sales import get_dashboard_summary
             result = await get_dashboard_summary(user_id="user-1")
 
         assert result.ytd_royalties == Decimal("9999.99")
@@ -185,8 +179,6 @@ class TestGetDashboardSummaryEndpoint:
             p_table = self._setup_periods_mock(mock_supabase, [])
             self._wire(mock_supabase, c_table, p_table)
 
-            from app.routers.sales import get_dashboard_summary
-            from datetime import datetime, timezone
             result = await get_dashboard_summary(user_id="user-1")
 
         expected_year = datetime.now(timezone.utc).year
@@ -207,11 +199,10 @@ class TestGetDashboardSummaryEndpoint:
             p_table = self._setup_periods_mock(mock_supabase, [])
             self._wire(mock_supabase, c_table, p_table)
 
-            from app.routers.sales import get_dashboard_summary
             result = await get_dashboard_summary(user_id="user-1")
 
         # periods table should NOT have been queried (early return)
-        assert not p_table.select.called
+        assert "select" not in p_table.calls
         assert result.ytd_royalties == Decimal("0")
 
     @pytest.mark.asyncio
@@ -221,7 +212,6 @@ class TestGetDashboardSummaryEndpoint:
         The endpoint depends on it via Depends(get_current_user).
         """
         with patch('app.routers.sales.supabase'):
-            from app.auth import get_current_user
             with pytest.raises(HTTPException) as exc_info:
                 await get_current_user(authorization=None)
 
@@ -241,23 +231,14 @@ class TestGetContractTotalsEndpoint:
 
     def _setup_periods_mock(self, mock_supabase, period_rows: list[dict]):
         """
-        Wire mock_supabase so that:
+        Point mock_supabase at a stub so that:
             table("sales_periods")
                 .select("royalty_calculated, period_start")
                 .eq("contract_id", ...)
                 .execute()
         returns the given rows.
         """
-        mock_exec = MagicMock()
-        mock_exec.execute.return_value = Mock(data=period_rows)
-        mock_eq = MagicMock()
-        mock_eq.execute.return_value = mock_exec.execute.return_value
-        mock_select = MagicMock()
-        mock_select.eq.return_value = mock_eq
-
-        mock_periods_table = MagicMock()
-        mock_periods_table.select.return_value = mock_select
-
+        mock_periods_table = _FakeQuery(period_rows)
         mock_supabase.table.return_value = mock_periods_table
         return mock_periods_table
 
@@ -274,7 +255,6 @@ class TestGetContractTotalsEndpoint:
 
             self._setup_periods_mock(mock_supabase, [])
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-1", user_id="user-1"
             )
@@ -295,7 +275,6 @@ class TestGetContractTotalsEndpoint:
                 [_period_row("8000.00", "2026-01-01")],
             )
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-1", user_id="user-1"
             )
@@ -321,7 +300,6 @@ class TestGetContractTotalsEndpoint:
                 ],
             )
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-1", user_id="user-1"
             )
@@ -346,7 +324,6 @@ class TestGetContractTotalsEndpoint:
                 ],
             )
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-1", user_id="user-1"
             )
@@ -370,7 +347,6 @@ class TestGetContractTotalsEndpoint:
                 ],
             )
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-1", user_id="user-1"
             )
@@ -394,7 +370,6 @@ class TestGetContractTotalsEndpoint:
                 ],
             )
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-1", user_id="user-1"
             )
@@ -416,7 +391,6 @@ class TestGetContractTotalsEndpoint:
                 [_period_row("1234.56", "2026-06-01")],
             )
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-1", user_id="user-1"
             )
@@ -436,7 +410,6 @@ class TestGetContractTotalsEndpoint:
 
             self._setup_periods_mock(mock_supabase, [])
 
-            from app.routers.sales import get_contract_totals
             await get_contract_totals(
                 contract_id="contract-99", user_id="user-1"
             )
@@ -452,7 +425,6 @@ class TestGetContractTotalsEndpoint:
 
             self._setup_periods_mock(mock_supabase, [])
 
-            from app.routers.sales import get_contract_totals
             result = await get_contract_totals(
                 contract_id="contract-abc", user_id="user-1"
             )
@@ -465,7 +437,6 @@ class TestGetContractTotalsEndpoint:
         get_current_user raises 401 when no Authorization header is provided.
         """
         with patch('app.routers.sales.supabase'):
-            from app.auth import get_current_user
             with pytest.raises(HTTPException) as exc_info:
                 await get_current_user(authorization=None)
 